@@ -3,10 +3,12 @@
 Based on proto/schema/v1.json
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Any, Dict, List, Optional, Literal
 from enum import Enum
 
+import orjson
+
 
 class MessageType(str, Enum):
     """WebSocket message types."""
@@ -20,20 +22,22 @@ class MessageType(str, Enum):
     COMPARE_STOP = "compare_stop"
     COMPARE_SET_SPEED = "compare_set_speed"
     SUBSCRIBE = "subscribe"
+    BATCH = "batch"
     OBS = "obs"
+    OBS_BATCH = "obs_batch"
     COMPARE_OBS = "compare_obs"
     COMPARE_COMPLETE = "compare_complete"
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class HelloRequest:
     """Client hello message."""
     type: Literal["hello"] = "hello"
     version: str = "s1.0.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class HelloResponse:
     """Server hello response."""
     type: Literal["hello"] = "hello"
@@ -41,21 +45,21 @@ class HelloResponse:
     server: str = "tetris-core-py"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResetRequest:
     """Request to reset the game."""
     seed: Optional[int] = None
     type: Literal["reset"] = "reset"
 
 
-@dataclass
+@dataclass(slots=True)
 class StepRequest:
     """Request to step the game with an action."""
     action: str  # Frame action: LEFT, RIGHT, CW, CCW, SOFT, HARD, HOLD, NOOP
     type: Literal["step"] = "step"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlacementStepRequest:
     """Request to step the game with a placement action."""
     x: int
@@ -64,7 +68,7 @@ class PlacementStepRequest:
     type: Literal["step_placement"] = "step_placement"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIPlayRequest:
     """Request to start AI agent playing."""
     agent_type: str  # "random" or "dellacherie"
@@ -74,13 +78,13 @@ class AIPlayRequest:
     type: Literal["ai_play"] = "ai_play"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIStopRequest:
     """Request to stop AI agent."""
     type: Literal["ai_stop"] = "ai_stop"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareStartRequest:
     """Request to start agent comparison."""
     agent1: str  # Agent type (e.g., "random", "dellacherie")
@@ -91,20 +95,20 @@ class CompareStartRequest:
     type: Literal["compare_start"] = "compare_start"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareStopRequest:
     """Request to stop agent comparison."""
     type: Literal["compare_stop"] = "compare_stop"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareSetSpeedRequest:
     """Request to change comparison speed during play."""
     speed: float
     type: Literal["compare_set_speed"] = "compare_set_speed"
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """State of a single game in comparison."""
     obs: Dict[str, Any]  # Full observation
@@ -113,7 +117,7 @@ class GameState:
     active: bool  # Still playing (not topped out yet)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonStats:
     """Comparison statistics between two agents."""
     both_done: bool
@@ -125,7 +129,7 @@ class ComparisonStats:
     avg_clear_agent2: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareObsResponse:
     """Observation response for comparison mode."""
     game1: GameState
@@ -134,7 +138,7 @@ class CompareObsResponse:
     type: Literal["compare_obs"] = "compare_obs"
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalGameStats:
     """Final statistics for one game."""
     score: int
@@ -144,7 +148,7 @@ class FinalGameStats:
     efficiency: float  # Score per line
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareCompleteResponse:
     """Final results when both agents finish."""
     winner: Optional[str]  # "agent1", "agent2", or None if tied
@@ -153,14 +157,14 @@ class CompareCompleteResponse:
     type: Literal["compare_complete"] = "compare_complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscribeRequest:
     """Request to subscribe to game state updates."""
     stream: bool = True
     type: Literal["subscribe"] = "subscribe"
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationResponse:
     """Game state observation response."""
     data: Dict[str, Any]  # Observation dict from env.to_dict()
@@ -170,7 +174,7 @@ class ObservationResponse:
     type: Literal["obs"] = "obs"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorResponse:
     """Error response."""
     code: str
@@ -188,6 +192,58 @@ class ErrorCode:
     VERSION_MISMATCH = "VERSION_MISMATCH"
 
 
+# orjson has no reusable encoder/decoder objects to cache (its module-level
+# functions carry no per-call setup); binding them once still skips the
+# attribute lookup on every frame.
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+
+def decode_message(raw) -> Dict[str, Any]:
+    """Decode a raw WebSocket frame payload (bytes or str) to a dict."""
+    return _loads(raw)
+
+
+# Message type tag -> request class, built once at import time so parse_message
+# is a single dict probe instead of an elif chain over Enum comparisons.
+_MESSAGE_CLASSES: Dict[str, Any] = {
+    MessageType.HELLO.value: HelloRequest,
+    MessageType.RESET.value: ResetRequest,
+    MessageType.STEP.value: StepRequest,
+    MessageType.STEP_PLACEMENT.value: PlacementStepRequest,
+    MessageType.AI_PLAY.value: AIPlayRequest,
+    MessageType.AI_STOP.value: AIStopRequest,
+    MessageType.COMPARE_START.value: CompareStartRequest,
+    MessageType.COMPARE_STOP.value: CompareStopRequest,
+    MessageType.COMPARE_SET_SPEED.value: CompareSetSpeedRequest,
+    MessageType.SUBSCRIBE.value: SubscribeRequest,
+}
+
+
+# Accepted constructor fields per message class, resolved once at import time
+# so parse_message can validate with a single set comparison.
+_MESSAGE_FIELDS: Dict[type, frozenset] = {
+    cls: frozenset(f.name for f in fields(cls)) for cls in _MESSAGE_CLASSES.values()
+}
+
+
+def encode_message(message: Any) -> bytes:
+    """Encode an outgoing message for the wire.
+
+    The wire format is JSON carried on binary WebSocket frames. Keeping the
+    encoding behind this single seam means a binary format (e.g. MessagePack)
+    can be swapped in later without touching the send sites.
+
+    Args:
+        message: Protocol dataclass instance or plain dict
+
+    Returns:
+        Encoded frame payload
+    """
+    payload = message if isinstance(message, dict) else to_dict(message)
+    return _dumps(payload)
+
+
 def parse_message(data: Dict[str, Any]) -> Any:
     """Parse incoming WebSocket message.
 
@@ -200,39 +256,67 @@ def parse_message(data: Dict[str, Any]) -> Any:
     Raises:
         ValueError: If message type is invalid
     """
-    msg_type = data.get("type")
-
-    if msg_type == MessageType.HELLO:
-        return HelloRequest(**data)
-    elif msg_type == MessageType.RESET:
-        return ResetRequest(**data)
-    elif msg_type == MessageType.STEP:
-        return StepRequest(**data)
-    elif msg_type == MessageType.STEP_PLACEMENT:
-        return PlacementStepRequest(**data)
-    elif msg_type == MessageType.AI_PLAY:
-        return AIPlayRequest(**data)
-    elif msg_type == MessageType.AI_STOP:
-        return AIStopRequest(**data)
-    elif msg_type == MessageType.COMPARE_START:
-        return CompareStartRequest(**data)
-    elif msg_type == MessageType.COMPARE_STOP:
-        return CompareStopRequest(**data)
-    elif msg_type == MessageType.COMPARE_SET_SPEED:
-        return CompareSetSpeedRequest(**data)
-    elif msg_type == MessageType.SUBSCRIBE:
-        return SubscribeRequest(**data)
-    else:
-        raise ValueError(f"Unknown message type: {msg_type}")
+    cls = _MESSAGE_CLASSES.get(data.get("type"))
+    if cls is None:
+        raise ValueError(f"Unknown message type: {data.get('type')}")
+    allowed = _MESSAGE_FIELDS[cls]
+    if not data.keys() <= allowed:
+        # Drop unknown keys so forward-compatible clients don't TypeError
+        data = {key: value for key, value in data.items() if key in allowed}
+    return cls(**data)
+
+
+# Per-class field-name cache for the shallow to_dict conversion below.
+# Slotted dataclasses have no __dict__, so fields() is resolved once per class.
+_FIELD_NAMES: Dict[type, tuple] = {}
+
+
+def _shallow_dict(obj: Any) -> Dict[str, Any]:
+    """Build a flat dict from a slotted dataclass without recursion."""
+    names = _FIELD_NAMES.get(type(obj))
+    if names is None:
+        names = tuple(f.name for f in fields(obj))
+        _FIELD_NAMES[type(obj)] = names
+    return {name: getattr(obj, name) for name in names}
 
 
 def to_dict(obj: Any) -> Dict[str, Any]:
     """Convert dataclass to dict for JSON serialization.
 
+    Avoids `dataclasses.asdict`, which recursively deep-copies nested dicts
+    (including the entire board observation) on every message. Observation
+    payloads are already plain dicts, so a shallow conversion is enough.
+
     Args:
         obj: Dataclass instance
 
     Returns:
         Dictionary representation
     """
-    return asdict(obj)
+    if isinstance(obj, ObservationResponse):
+        return {
+            "type": obj.type,
+            "data": obj.data,
+            "reward": obj.reward,
+            "done": obj.done,
+            "info": obj.info,
+        }
+
+    if isinstance(obj, CompareObsResponse):
+        return {
+            "type": obj.type,
+            "game1": _shallow_dict(obj.game1),
+            "game2": _shallow_dict(obj.game2),
+            "comparison": _shallow_dict(obj.comparison),
+        }
+
+    if isinstance(obj, CompareCompleteResponse):
+        return {
+            "type": obj.type,
+            "winner": obj.winner,
+            "game1": _shallow_dict(obj.game1),
+            "game2": _shallow_dict(obj.game2),
+        }
+
+    # Flat dataclasses (hello, error, ack responses) have no nested fields
+    return _shallow_dict(obj)
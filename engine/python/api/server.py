@@ -1,11 +1,13 @@
 """FastAPI WebSocket server for TetrisCore."""
 
-import json
 import random
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import orjson
+
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -17,25 +19,18 @@ from tetris_core.env import TetrisEnv, FrameAction, PlacementAction
 from tetris_core.agents import RandomAgent, DellacherieAgent, SmartDellacherieAgent
 from api.protocol import (
     MessageType,
-    HelloRequest,
     HelloResponse,
-    ResetRequest,
     StepRequest,
     PlacementStepRequest,
-    AIPlayRequest,
-    AIStopRequest,
-    CompareStartRequest,
-    CompareStopRequest,
-    CompareSetSpeedRequest,
-    SubscribeRequest,
     ObservationResponse,
-    ErrorResponse,
     ErrorCode,
     GameState,
     ComparisonStats,
     CompareObsResponse,
     FinalGameStats,
     CompareCompleteResponse,
+    decode_message,
+    encode_message,
     parse_message,
     to_dict,
 )
@@ -52,19 +47,135 @@ app.add_middleware(
 )
 
 
+# Constant frames, serialized once at import time instead of per message
+_HELLO_FRAME = encode_message(HelloResponse())
+_AI_STOPPED_FRAME = encode_message({"type": "ai_stopped"})
+_COMPARE_STOPPED_FRAME = encode_message({"type": "compare_stopped"})
+_SUBSCRIBE_ACK_FRAMES = {
+    True: encode_message({"type": "subscribe_ack", "streaming": True}),
+    False: encode_message({"type": "subscribe_ack", "streaming": False}),
+}
+
+
 class GameSession:
     """Manages a single game session."""
 
     def __init__(self, websocket: WebSocket):
         self.env: Optional[TetrisEnv] = None
         self.initialized = False
-        self.streaming = False
+        # Streaming defaults on (the web UI expects per-piece frames);
+        # subscribe with stream=false for silent-then-summary runs
+        self.streaming = True
         self.ai_playing = False
-        self.ai_task: Optional[asyncio.Task] = None
         self.comparing = False
-        self.comparison_task: Optional[asyncio.Task] = None
+        # Comparison environments, reused across compare runs like self.env
+        self.cmp_env1: Optional[TetrisEnv] = None
+        self.cmp_env2: Optional[TetrisEnv] = None
         self.comparison_speed = 1.0  # Mutable speed for dynamic adjustment
         self.websocket = websocket
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # Agent selection is pure CPU; it runs on this executor so stop and
+        # speed messages stay responsive mid-search (threads spawn on demand)
+        self._cpu_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-cpu")
+        # One long-lived worker runs playback/comparison jobs; rearming it
+        # avoids creating a fresh Task per ai_play/compare_start request
+        self._job = None
+        self._job_ready = asyncio.Event()
+        self._worker_task: Optional[asyncio.Task] = None
+
+    def submit_job(self, job) -> None:
+        """Hand a playback/comparison coroutine to the session worker task.
+
+        Args:
+            job: Coroutine to run (run_ai_playback or run_comparison)
+        """
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker_loop())
+        if self._job is not None:
+            # A job is already queued; drop the new one (close silences the
+            # never-awaited warning)
+            job.close()
+            return
+        self._job = job
+        self._job_ready.set()
+
+    async def _worker_loop(self) -> None:
+        """Run submitted jobs one at a time on a single long-lived task."""
+        while True:
+            await self._job_ready.wait()
+            self._job_ready.clear()
+            job, self._job = self._job, None
+            if job is None:
+                continue
+            try:
+                await job
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Worker] Job error: {e}", exc_info=True)
+
+    def stop_worker(self) -> None:
+        """Cancel the session worker task, if running."""
+        if self._worker_task and not self._worker_task.done():
+            self._worker_task.cancel()
+
+    def start_writer(self) -> None:
+        """Start the session writer task (idempotent)."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    def enqueue_send(self, message) -> None:
+        """Queue an outbound message for the session writer task.
+
+        Every send on the connection goes through a single writer coroutine:
+        send ordering is preserved, producers never block on a slow client,
+        and consecutive ready frames are flushed back to back by one task.
+
+        Args:
+            message: Protocol dataclass instance or plain dict
+        """
+        self.enqueue_frame(encode_message(message))
+
+    def enqueue_frame(self, frame: bytes) -> None:
+        """Queue an already-encoded frame for the session writer task.
+
+        Args:
+            frame: Encoded frame payload
+        """
+        if self._writer_task is None or self._writer_task.done():
+            self.start_writer()
+        self._outbox.put_nowait(frame)
+
+    async def _writer_loop(self) -> None:
+        """Drain queued frames and send them in order on the WebSocket."""
+        try:
+            while True:
+                frame = await self._outbox.get()
+                await self.websocket.send_bytes(frame)
+                # Flush whatever is already queued before awaiting again
+                while not self._outbox.empty():
+                    await self.websocket.send_bytes(self._outbox.get_nowait())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[Writer] Send failed (client may have disconnected): {e}")
+            # Stop the producers so the queue doesn't grow unbounded
+            self.ai_playing = False
+            self.comparing = False
+
+    def stop_writer(self) -> None:
+        """Cancel the session writer task, if running."""
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+
+    def close(self) -> None:
+        """Tear down background tasks and the CPU executor on disconnect."""
+        self.stop_ai()
+        self.stop_comparison()
+        self.stop_worker()
+        self.stop_writer()
+        self._cpu_pool.shutdown(wait=False)
 
     def reset(self, seed: Optional[int] = None) -> ObservationResponse:
         """Reset the game environment.
@@ -107,9 +218,10 @@ class GameSession:
         if not self.initialized or self.env is None:
             raise ValueError("Game not initialized. Send reset first.")
 
-        try:
-            frame_action = FrameAction[action]
-        except KeyError:
+        # Plain lookup instead of KeyError-as-control-flow; bad tokens are a
+        # client input error, not an exceptional server state
+        frame_action = FrameAction.__members__.get(action)
+        if frame_action is None:
             raise ValueError(f"Invalid action: {action}")
 
         result = self.env.step(frame_action)
@@ -159,16 +271,19 @@ class GameSession:
         self.streaming = enabled
 
     def stop_ai(self) -> None:
-        """Stop AI playback."""
+        """Stop AI playback.
+
+        Flag-only: the playback loop checks ai_playing each iteration, so the
+        worker task is rearmed for the next job instead of being cancelled.
+        """
         self.ai_playing = False
-        if self.ai_task and not self.ai_task.done():
-            self.ai_task.cancel()
 
     def stop_comparison(self) -> None:
-        """Stop agent comparison."""
+        """Stop agent comparison.
+
+        Flag-only, like stop_ai: the comparison loop exits on its next check.
+        """
         self.comparing = False
-        if self.comparison_task and not self.comparison_task.done():
-            self.comparison_task.cancel()
 
     async def run_ai_playback(
         self, agent, speed: float, max_pieces: int, seed: Optional[int] = None
@@ -184,51 +299,69 @@ class GameSession:
         try:
             agent.on_episode_start(seed or 0)
             pieces_played = 0
-            delay = 1.0 / speed  # 1x speed = 1 second per piece
+            obs_response = None
+            # speed <= 0 means "as fast as possible": skip pacing entirely
+            delay = 1.0 / speed if speed > 0 else 0.0  # 1x speed = 1 second per piece
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
 
             logger.info(f"[AI Playback] Starting: agent={agent.name}, speed={speed}x, max_pieces={max_pieces}")
 
             while self.ai_playing and not self.env.done and pieces_played < max_pieces:
                 # Get current observation
-                logger.info(f"[AI Loop] Piece {pieces_played}: Building observation...")
+                logger.debug(f"[AI Loop] Piece {pieces_played}: Building observation...")
                 obs = self.env._build_observation()
-                logger.info(f"[AI Loop] Legal moves: {len(obs.legal_moves)}, done={self.env.done}")
+                logger.debug(f"[AI Loop] Legal moves: {len(obs.legal_moves)}, done={self.env.done}")
 
                 # Check if topped out BEFORE agent selection
                 if not obs.legal_moves:
-                    logger.info(f"[AI Loop] No legal moves - game over")
+                    logger.debug(f"[AI Loop] No legal moves - game over")
                     self.env.done = True
                     break
 
                 # Agent selects action
-                logger.info(f"[AI Loop] Agent selecting action from {len(obs.legal_moves)} moves...")
-                action = agent.select_action(obs)
-                logger.info(f"[AI Loop] Agent selected: x={action.x}, rot={action.rot}, hold={action.use_hold}")
+                logger.debug(f"[AI Loop] Agent selecting action from {len(obs.legal_moves)} moves...")
+                action = await loop.run_in_executor(self._cpu_pool, agent.select_action, obs)
+                logger.debug(f"[AI Loop] Agent selected: x={action.x}, rot={action.rot}, hold={action.use_hold}")
 
                 # Execute placement action
-                logger.info(f"[AI Loop] Executing placement...")
+                logger.debug(f"[AI Loop] Executing placement...")
                 obs_response = self.step_placement(
                     action.x, action.rot, action.use_hold
                 )
-                logger.info(f"[AI Loop] Placement done. done={obs_response.done}")
+                logger.debug(f"[AI Loop] Placement done. done={obs_response.done}")
 
-                # Send observation to client
-                logger.info(f"[AI Loop] Sending observation to client...")
-                await self.websocket.send_text(json.dumps(to_dict(obs_response)))
-                logger.info(f"[AI Loop] Observation sent")
+                # Hand the observation to the session writer task; skipped
+                # entirely when the client opted out of streaming
+                if self.streaming:
+                    logger.debug(f"[AI Loop] Sending observation to client...")
+                    self.enqueue_send(obs_response)
 
                 # Check if game ended
                 if obs_response.done:
-                    logger.info(f"[AI Loop] Game ended: pieces={pieces_played}, score={obs_response.data.get('episode', {}).get('score', 0)}")
+                    logger.debug(f"[AI Loop] Game ended: pieces={pieces_played}, score={obs_response.data.get('episode', {}).get('score', 0)}")
                     break
 
                 pieces_played += 1
 
-                # Delay for visualization
-                logger.info(f"[AI Loop] Sleeping {delay}s...")
-                await asyncio.sleep(delay)
+                # Pace against a monotonic deadline so compute time is not
+                # added on top of the per-piece delay; when behind (or when
+                # unthrottled), yield so stop messages are still serviced
+                if delay > 0:
+                    next_tick += delay
+                    sleep_for = next_tick - loop.time()
+                    if sleep_for > 0:
+                        await asyncio.sleep(sleep_for)
+                    else:
+                        next_tick = loop.time()
+                        await asyncio.sleep(0)
+                else:
+                    await asyncio.sleep(0)
 
-            # AI finished naturally
+            # AI finished naturally; a non-streaming client still gets the
+            # final observation as a summary
+            if not self.streaming and obs_response is not None:
+                self.enqueue_send(obs_response)
             self.ai_playing = False
             logger.info(f"[AI Playback] Ended: done={self.env.done}, pieces={pieces_played}")
 
@@ -237,6 +370,10 @@ class GameSession:
             logger.info(f"[AI Playback] Cancelled by user")
             self.ai_playing = False
             raise
+        except (WebSocketDisconnect, ConnectionError):
+            # Client went away mid-game; expected, no traceback formatting
+            logger.info("[AI Playback] Client disconnected")
+            self.ai_playing = False
         except Exception as e:
             # Error during AI playback
             logger.error(f"[AI Playback] Error: {e}", exc_info=True)
@@ -259,9 +396,13 @@ class GameSession:
             if seed is None:
                 seed = random.randint(0, 1_000_000)
 
-            # Create two independent environments with same seed
-            env1 = TetrisEnv()
-            env2 = TetrisEnv()
+            # Two independent environments with the same seed, reused across
+            # comparison runs on this session (mirrors the reset() pattern)
+            if self.cmp_env1 is None:
+                self.cmp_env1 = TetrisEnv()
+                self.cmp_env2 = TetrisEnv()
+            env1 = self.cmp_env1
+            env2 = self.cmp_env2
             env1.reset(seed)
             env2.reset(seed)
 
@@ -274,14 +415,30 @@ class GameSession:
             pieces2 = 0
             active1 = True  # Agent 1 still playing
             active2 = True  # Agent 2 still playing
-            lines_cleared_count1 = []  # Track each clear size for agent 1
-            lines_cleared_count2 = []  # Track each clear size for agent 2
+            # Incremental clear-size accumulators (sum/count per agent)
+            clears1_sum = 0
+            clears1_count = 0
+            clears2_sum = 0
+            clears2_count = 0
 
             # Set initial speed (can be changed dynamically during play)
             self.comparison_speed = speed
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
 
             logger.info(f"[Comparison] Starting: agent1={agent1.name}, agent2={agent2.name}, seed={seed}, max_pieces={max_pieces}")
 
+            # Each env's observation is built once per step and reused for
+            # both agent selection and the outbound payload
+            obs1 = env1._build_observation()
+            obs2 = env2._build_observation()
+
+            # Per-tick statistics, also reused for the final results
+            score1 = score2 = 0
+            lines1 = lines2 = 0
+            eff1 = eff2 = 0
+            leader = None
+
             # Continue until BOTH agents finish
             while self.comparing and (active1 or active2):
                 # Step agent 1 if still active
@@ -290,17 +447,21 @@ class GameSession:
                         active1 = False
                         logger.info(f"[Comparison] Agent 1 reached max pieces: {pieces1}")
                     else:
-                        obs1 = env1._build_observation()
                         if not obs1.legal_moves or env1.done:
                             active1 = False
                             logger.info(f"[Comparison] Agent 1 finished: pieces={pieces1}")
                         else:
-                            action1 = agent1.select_action(obs1)
+                            action1 = await loop.run_in_executor(
+                                self._cpu_pool, agent1.select_action, obs1
+                            )
                             result1 = env1.step_placement(PlacementAction(action1.x, action1.rot, action1.use_hold))
+                            obs1 = result1.obs
 
                             # Track line clears
-                            if result1.info.get("lines_cleared", 0) > 0:
-                                lines_cleared_count1.append(result1.info["lines_cleared"])
+                            lines_cleared = result1.info.get("lines_cleared", 0)
+                            if lines_cleared > 0:
+                                clears1_sum += lines_cleared
+                                clears1_count += 1
 
                             if result1.done:
                                 active1 = False
@@ -313,40 +474,43 @@ class GameSession:
                         active2 = False
                         logger.info(f"[Comparison] Agent 2 reached max pieces: {pieces2}")
                     else:
-                        obs2 = env2._build_observation()
                         if not obs2.legal_moves or env2.done:
                             active2 = False
                             logger.info(f"[Comparison] Agent 2 finished: pieces={pieces2}")
                         else:
-                            action2 = agent2.select_action(obs2)
+                            action2 = await loop.run_in_executor(
+                                self._cpu_pool, agent2.select_action, obs2
+                            )
                             result2 = env2.step_placement(PlacementAction(action2.x, action2.rot, action2.use_hold))
+                            obs2 = result2.obs
 
                             # Track line clears
-                            if result2.info.get("lines_cleared", 0) > 0:
-                                lines_cleared_count2.append(result2.info["lines_cleared"])
+                            lines_cleared = result2.info.get("lines_cleared", 0)
+                            if lines_cleared > 0:
+                                clears2_sum += lines_cleared
+                                clears2_count += 1
 
                             if result2.done:
                                 active2 = False
                                 logger.info(f"[Comparison] Agent 2 topped out: pieces={pieces2}")
                             pieces2 += 1
 
-                # Build current observations
-                obs1 = env1._build_observation()
-                obs2 = env2._build_observation()
-
-                # Calculate statistics
+                # Snapshot env state once per tick; everything below works
+                # from these locals
                 score1 = env1.score
                 score2 = env2.score
                 lines1 = env1.lines_total
                 lines2 = env2.lines_total
+                done1 = env1.done
+                done2 = env2.done
 
                 # Efficiency: score per line (avoid division by zero)
                 eff1 = score1 / lines1 if lines1 > 0 else 0
                 eff2 = score2 / lines2 if lines2 > 0 else 0
 
                 # Average clear size
-                avg_clear1 = sum(lines_cleared_count1) / len(lines_cleared_count1) if lines_cleared_count1 else 0
-                avg_clear2 = sum(lines_cleared_count2) / len(lines_cleared_count2) if lines_cleared_count2 else 0
+                avg_clear1 = clears1_sum / clears1_count if clears1_count else 0
+                avg_clear2 = clears2_sum / clears2_count if clears2_count else 0
 
                 # Determine leader
                 score_diff = score2 - score1
@@ -363,13 +527,13 @@ class GameSession:
                 compare_obs = CompareObsResponse(
                     game1=GameState(
                         obs=obs1.to_dict(),
-                        done=env1.done,
+                        done=done1,
                         pieces_played=pieces1,
                         active=active1
                     ),
                     game2=GameState(
                         obs=obs2.to_dict(),
-                        done=env2.done,
+                        done=done2,
                         pieces_played=pieces2,
                         active=active2
                     ),
@@ -389,27 +553,31 @@ class GameSession:
                     logger.info(f"[Comparison] Both agents finished")
                     break
 
-                # Send periodic update (but don't break if it fails - we want to finish the game)
-                try:
-                    await self.websocket.send_text(json.dumps(to_dict(compare_obs)))
-                except Exception as e:
-                    logger.warning(f"[Comparison] Failed to send update (client may have disconnected): {e}")
-                    # Continue anyway - we want to complete the comparison
-
-                # Delay for visualization (use current speed, which can change during play)
-                delay = 1.0 / self.comparison_speed
-                await asyncio.sleep(delay)
-
-            # Send final results
-            eff1_final = score1 / lines1 if lines1 > 0 else 0
-            eff2_final = score2 / lines2 if lines2 > 0 else 0
+                # Queue periodic update on the writer task (skipped when the
+                # client opted out of streaming); a failed send stops the
+                # writer but never breaks the game loop itself
+                if self.streaming:
+                    self.enqueue_send(compare_obs)
+
+                # Pace against a monotonic deadline (re-read the speed each
+                # tick, it can change during play); speed <= 0 means
+                # unthrottled, where a bare yield keeps stop messages serviced
+                speed_now = self.comparison_speed
+                if speed_now > 0:
+                    next_tick += 1.0 / speed_now
+                    sleep_for = next_tick - loop.time()
+                    if sleep_for > 0:
+                        await asyncio.sleep(sleep_for)
+                    else:
+                        next_tick = loop.time()
+                        await asyncio.sleep(0)
+                else:
+                    await asyncio.sleep(0)
 
-            if score1 > score2:
-                winner = "agent1"
-            elif score2 > score1:
-                winner = "agent2"
-            else:
-                winner = None
+            # Final results reuse the last tick's statistics: the leader of
+            # the final tick is the winner, and the efficiencies are already
+            # computed, so nothing is re-derived from the envs here
+            winner = leader
 
             complete = CompareCompleteResponse(
                 winner=winner,
@@ -418,22 +586,20 @@ class GameSession:
                     lines=lines1,
                     pieces=pieces1,
                     topped_out=env1.done,
-                    efficiency=round(eff1_final, 1)
+                    efficiency=round(eff1, 1)
                 ),
                 game2=FinalGameStats(
                     score=score2,
                     lines=lines2,
                     pieces=pieces2,
                     topped_out=env2.done,
-                    efficiency=round(eff2_final, 1)
+                    efficiency=round(eff2, 1)
                 )
             )
 
-            try:
-                await self.websocket.send_text(json.dumps(to_dict(complete)))
-                logger.info(f"[Comparison] Complete message sent: winner={winner}")
-            except Exception as e:
-                logger.warning(f"[Comparison] Failed to send complete message (client may have disconnected): {e}")
+            # Queued after all periodic updates, so it arrives last and in order
+            self.enqueue_send(complete)
+            logger.info(f"[Comparison] Complete message queued: winner={winner}")
 
             self.comparing = False
             logger.info(f"[Comparison] Complete: winner={winner}")
@@ -442,15 +608,15 @@ class GameSession:
             logger.info(f"[Comparison] Cancelled by user")
             self.comparing = False
             raise
+        except (WebSocketDisconnect, ConnectionError):
+            # Client went away mid-game; expected, and sending the error
+            # frame would only fail again
+            logger.info("[Comparison] Client disconnected")
+            self.comparing = False
         except Exception as e:
             logger.error(f"[Comparison] Error: {e}", exc_info=True)
             self.comparing = False
-            error = ErrorResponse(
-                type="error",
-                code=ErrorCode.INVALID_MESSAGE,
-                message=f"AI playback error: {str(e)}",
-            )
-            await self.websocket.send_text(json.dumps(to_dict(error)))
+            _send_error(self, ErrorCode.INVALID_MESSAGE, f"AI playback error: {str(e)}")
 
 
 @app.get("/")
@@ -465,252 +631,293 @@ async def health():
     return {"status": "healthy"}
 
 
+# Encoded error-frame prefix per code; only the message varies at runtime.
+# The assembled frame matches the ErrorResponse wire shape exactly.
+_ERROR_PREFIXES = {
+    code: b'{"type":"error","code":"' + code.encode() + b'","message":'
+    for code in (
+        ErrorCode.INVALID_MESSAGE,
+        ErrorCode.INVALID_ACTION,
+        ErrorCode.GAME_NOT_INITIALIZED,
+        ErrorCode.GAME_OVER,
+        ErrorCode.VERSION_MISMATCH,
+    )
+}
+_ERROR_SUFFIX = b',"details":null}'
+
+
+def _send_error(session: "GameSession", code: str, message: str) -> None:
+    """Queue an error frame for the client.
+
+    Assembles the frame from a per-code prefix template, so only the
+    message string is JSON-encoded at runtime.
+    """
+    session.enqueue_frame(_ERROR_PREFIXES[code] + orjson.dumps(message) + _ERROR_SUFFIX)
+
+
+# Agent type name -> constructor, shared by ai_play and compare_start
+AGENTS = {
+    "random": RandomAgent,
+    "dellacherie": DellacherieAgent,
+    "smartdellacherie": SmartDellacherieAgent,
+}
+
+
+def _create_agent(agent_type: str):
+    """Create an agent instance by type name, or None if unknown."""
+    cls = AGENTS.get(agent_type.lower())
+    return cls() if cls is not None else None
+
+
+async def _handle_hello(session: "GameSession", websocket: WebSocket, message) -> None:
+    session.enqueue_frame(_HELLO_FRAME)
+
+
+async def _handle_reset(session: "GameSession", websocket: WebSocket, message) -> None:
+    try:
+        obs_response = session.reset(message.seed)
+        session.enqueue_send(obs_response)
+    except Exception as e:
+        _send_error(session, ErrorCode.INVALID_MESSAGE, str(e))
+
+
+async def _handle_step(session: "GameSession", websocket: WebSocket, message) -> None:
+    try:
+        obs_response = session.step(message.action)
+        session.enqueue_send(obs_response)
+    except ValueError as e:
+        _send_error(session, ErrorCode.INVALID_ACTION, str(e))
+    except Exception as e:
+        _send_error(session, ErrorCode.GAME_NOT_INITIALIZED, str(e))
+
+
+async def _handle_step_placement(session: "GameSession", websocket: WebSocket, message) -> None:
+    try:
+        obs_response = session.step_placement(message.x, message.rot, message.use_hold)
+        session.enqueue_send(obs_response)
+    except ValueError as e:
+        _send_error(session, ErrorCode.INVALID_ACTION, str(e))
+    except Exception as e:
+        _send_error(session, ErrorCode.GAME_NOT_INITIALIZED, str(e))
+
+
+async def _handle_ai_play(session: "GameSession", websocket: WebSocket, message) -> None:
+    logger.info(f"[WS] Received AI play request: agent={message.agent_type}, speed={message.speed}")
+    try:
+        agent = _create_agent(message.agent_type)
+        if agent is None:
+            _send_error(
+                session,
+                ErrorCode.INVALID_MESSAGE,
+                f"Unknown agent type: {message.agent_type}",
+            )
+            return
+
+        # Initialize game if not started yet (takeover mode)
+        if not session.initialized:
+            logger.info(f"[WS] Initializing game for AI play")
+            obs_response = session.reset(message.seed)
+            session.enqueue_send(obs_response)
+
+        # Hand AI playback to the session worker task
+        logger.info(f"[WS] Starting AI playback job...")
+        session.ai_playing = True
+        max_pieces = message.max_pieces or 1000
+        session.submit_job(
+            session.run_ai_playback(
+                agent=agent,
+                speed=message.speed,
+                max_pieces=max_pieces,
+                seed=message.seed,
+            )
+        )
+
+    except Exception as e:
+        session.ai_playing = False
+        _send_error(session, ErrorCode.INVALID_MESSAGE, f"AI play error: {str(e)}")
+
+
+async def _handle_ai_stop(session: "GameSession", websocket: WebSocket, message) -> None:
+    logger.info(f"[WS] Received AI stop request")
+    session.stop_ai()
+    logger.info(f"[WS] AI stopped, ai_playing={session.ai_playing}")
+    session.enqueue_frame(_AI_STOPPED_FRAME)
+
+
+async def _handle_compare_start(session: "GameSession", websocket: WebSocket, message) -> None:
+    logger.info(f"[WS] Received compare start request: agent1={message.agent1}, agent2={message.agent2}")
+    try:
+        agent1 = _create_agent(message.agent1)
+        if agent1 is None:
+            _send_error(
+                session, ErrorCode.INVALID_MESSAGE, f"Unknown agent type: {message.agent1}"
+            )
+            return
+
+        agent2 = _create_agent(message.agent2)
+        if agent2 is None:
+            _send_error(
+                session, ErrorCode.INVALID_MESSAGE, f"Unknown agent type: {message.agent2}"
+            )
+            return
+
+        # Hand the comparison to the session worker task
+        logger.info(f"[WS] Starting comparison job...")
+        session.comparing = True
+        session.submit_job(
+            session.run_comparison(
+                agent1=agent1,
+                agent2=agent2,
+                speed=message.speed,
+                max_pieces=message.max_pieces,
+                seed=message.seed,
+            )
+        )
+
+    except Exception as e:
+        session.comparing = False
+        _send_error(session, ErrorCode.INVALID_MESSAGE, f"Comparison error: {str(e)}")
+
+
+async def _handle_compare_stop(session: "GameSession", websocket: WebSocket, message) -> None:
+    logger.info(f"[WS] Received compare stop request")
+    session.stop_comparison()
+    logger.info(f"[WS] Comparison stopped, comparing={session.comparing}")
+    session.enqueue_frame(_COMPARE_STOPPED_FRAME)
+
+
+async def _handle_compare_set_speed(session: "GameSession", websocket: WebSocket, message) -> None:
+    # Speed changes can arrive as a rapid slider drag; a bare attribute write
+    # is all that's needed (the comparison loop re-reads it every tick) and
+    # no response is sent
+    session.comparison_speed = message.speed
+    logger.debug(f"[WS] Comparison speed updated to {message.speed}x")
+
+
+async def _handle_subscribe(session: "GameSession", websocket: WebSocket, message) -> None:
+    session.set_streaming(bool(message.stream))
+    # Send acknowledgment
+    session.enqueue_frame(_SUBSCRIBE_ACK_FRAMES[session.streaming])
+
+
+async def _handle_batch(session: "GameSession", websocket: WebSocket, message_dict: dict) -> None:
+    """Execute a burst of step messages back to back.
+
+    Answered with a single obs_batch frame, amortizing the per-frame WS and
+    encode overhead during AI streaming.
+    """
+    # Parse and validate the whole batch before executing any of it, so a
+    # rejected batch never leaves half-applied steps behind: message types
+    # and frame-action tokens are both checked up front
+    sub_messages = [parse_message(sub) for sub in message_dict.get("msgs", [])]
+    for sub_message in sub_messages:
+        if isinstance(sub_message, StepRequest):
+            if FrameAction.__members__.get(sub_message.action) is None:
+                raise ValueError(f"Invalid action: {sub_message.action}")
+        elif not isinstance(sub_message, PlacementStepRequest):
+            raise ValueError("Only step messages may be batched")
+
+    items = []
+    for sub_message in sub_messages:
+        if isinstance(sub_message, StepRequest):
+            items.append(to_dict(session.step(sub_message.action)))
+        else:
+            items.append(
+                to_dict(
+                    session.step_placement(sub_message.x, sub_message.rot, sub_message.use_hold)
+                )
+            )
+    session.enqueue_send({"type": "obs_batch", "items": items})
+
+
+# Message type tag -> handler coroutine; one dict probe per message instead
+# of an isinstance cascade
+_HANDLERS = {
+    MessageType.HELLO.value: _handle_hello,
+    MessageType.RESET.value: _handle_reset,
+    MessageType.STEP.value: _handle_step,
+    MessageType.STEP_PLACEMENT.value: _handle_step_placement,
+    MessageType.AI_PLAY.value: _handle_ai_play,
+    MessageType.AI_STOP.value: _handle_ai_stop,
+    MessageType.COMPARE_START.value: _handle_compare_start,
+    MessageType.COMPARE_STOP.value: _handle_compare_stop,
+    MessageType.COMPARE_SET_SPEED.value: _handle_compare_set_speed,
+    MessageType.SUBSCRIBE.value: _handle_subscribe,
+}
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for game communication."""
     await websocket.accept()
     session = GameSession(websocket)
+    session.start_writer()
 
     try:
         while True:
-            # Receive message
-            data = await websocket.receive_text()
+            # Receive message. Accept text or binary frames: orjson parses
+            # bytes directly, so binary clients skip the utf-8 decode pass.
+            packet = await websocket.receive()
+            if packet["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(packet.get("code", 1000))
+            data = packet["bytes"] if packet.get("bytes") is not None else packet["text"]
 
             try:
-                message_dict = json.loads(data)
-                message = parse_message(message_dict)
-
-                # Handle different message types
-                if isinstance(message, HelloRequest):
-                    response = HelloResponse()
-                    await websocket.send_text(json.dumps(to_dict(response)))
-
-                elif isinstance(message, ResetRequest):
-                    try:
-                        obs_response = session.reset(message.seed)
-                        await websocket.send_text(json.dumps(to_dict(obs_response)))
-                    except Exception as e:
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.INVALID_MESSAGE,
-                            message=str(e),
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-
-                elif isinstance(message, StepRequest):
-                    try:
-                        obs_response = session.step(message.action)
-                        await websocket.send_text(json.dumps(to_dict(obs_response)))
-                    except ValueError as e:
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.INVALID_ACTION,
-                            message=str(e),
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-                    except Exception as e:
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.GAME_NOT_INITIALIZED,
-                            message=str(e),
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-
-                elif isinstance(message, PlacementStepRequest):
-                    try:
-                        obs_response = session.step_placement(
-                            message.x, message.rot, message.use_hold
-                        )
-                        await websocket.send_text(json.dumps(to_dict(obs_response)))
-                    except ValueError as e:
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.INVALID_ACTION,
-                            message=str(e),
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-                    except Exception as e:
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.GAME_NOT_INITIALIZED,
-                            message=str(e),
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-
-                elif isinstance(message, AIPlayRequest):
-                    logger.info(f"[WS] Received AI play request: agent={message.agent_type}, speed={message.speed}")
-                    try:
-                        # Create agent based on type
-                        if message.agent_type.lower() == "random":
-                            agent = RandomAgent()
-                        elif message.agent_type.lower() == "dellacherie":
-                            agent = DellacherieAgent()
-                        elif message.agent_type.lower() == "smartdellacherie":
-                            agent = SmartDellacherieAgent()
-                        else:
-                            error = ErrorResponse(
-                                type="error",
-                                code=ErrorCode.INVALID_MESSAGE,
-                                message=f"Unknown agent type: {message.agent_type}",
-                            )
-                            await websocket.send_text(json.dumps(to_dict(error)))
-                            continue
-
-                        # Initialize game if not started yet (takeover mode)
-                        if not session.initialized:
-                            logger.info(f"[WS] Initializing game for AI play")
-                            obs_response = session.reset(message.seed)
-                            await websocket.send_text(json.dumps(to_dict(obs_response)))
-
-                        # Start AI playback as background task
-                        logger.info(f"[WS] Starting AI playback task...")
-                        session.ai_playing = True
-                        max_pieces = message.max_pieces or 1000
-                        session.ai_task = asyncio.create_task(
-                            session.run_ai_playback(
-                                agent=agent,
-                                speed=message.speed,
-                                max_pieces=max_pieces,
-                                seed=message.seed,
-                            )
-                        )
-                        logger.info(f"[WS] AI playback task created: {session.ai_task}")
-
-                    except Exception as e:
-                        session.ai_playing = False
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.INVALID_MESSAGE,
-                            message=f"AI play error: {str(e)}",
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-
-                elif isinstance(message, AIStopRequest):
-                    logger.info(f"[WS] Received AI stop request")
-                    session.stop_ai()
-                    logger.info(f"[WS] AI stopped, ai_playing={session.ai_playing}")
-                    response = {"type": "ai_stopped"}
-                    await websocket.send_text(json.dumps(response))
-
-                elif isinstance(message, CompareStartRequest):
-                    logger.info(f"[WS] Received compare start request: agent1={message.agent1}, agent2={message.agent2}")
-                    try:
-                        # Create agents based on types
-                        if message.agent1.lower() == "random":
-                            agent1 = RandomAgent()
-                        elif message.agent1.lower() == "dellacherie":
-                            agent1 = DellacherieAgent()
-                        elif message.agent1.lower() == "smartdellacherie":
-                            agent1 = SmartDellacherieAgent()
-                        else:
-                            error = ErrorResponse(
-                                type="error",
-                                code=ErrorCode.INVALID_MESSAGE,
-                                message=f"Unknown agent type: {message.agent1}",
-                            )
-                            await websocket.send_text(json.dumps(to_dict(error)))
-                            continue
-
-                        if message.agent2.lower() == "random":
-                            agent2 = RandomAgent()
-                        elif message.agent2.lower() == "dellacherie":
-                            agent2 = DellacherieAgent()
-                        elif message.agent2.lower() == "smartdellacherie":
-                            agent2 = SmartDellacherieAgent()
-                        else:
-                            error = ErrorResponse(
-                                type="error",
-                                code=ErrorCode.INVALID_MESSAGE,
-                                message=f"Unknown agent type: {message.agent2}",
-                            )
-                            await websocket.send_text(json.dumps(to_dict(error)))
-                            continue
-
-                        # Start comparison as background task
-                        logger.info(f"[WS] Starting comparison task...")
-                        session.comparing = True
-                        session.comparison_task = asyncio.create_task(
-                            session.run_comparison(
-                                agent1=agent1,
-                                agent2=agent2,
-                                speed=message.speed,
-                                max_pieces=message.max_pieces,
-                                seed=message.seed,
-                            )
-                        )
-                        logger.info(f"[WS] Comparison task created: {session.comparison_task}")
-
-                    except Exception as e:
-                        session.comparing = False
-                        error = ErrorResponse(
-                            type="error",
-                            code=ErrorCode.INVALID_MESSAGE,
-                            message=f"Comparison error: {str(e)}",
-                        )
-                        await websocket.send_text(json.dumps(to_dict(error)))
-
-                elif isinstance(message, CompareStopRequest):
-                    logger.info(f"[WS] Received compare stop request")
-                    session.stop_comparison()
-                    logger.info(f"[WS] Comparison stopped, comparing={session.comparing}")
-                    response = {"type": "compare_stopped"}
-                    await websocket.send_text(json.dumps(response))
-
-                elif isinstance(message, CompareSetSpeedRequest):
-                    logger.info(f"[WS] Received compare set speed request: {message.speed}")
-                    session.comparison_speed = message.speed
-                    logger.info(f"[WS] Comparison speed updated to {session.comparison_speed}x")
-                    # No response needed - speed change takes effect immediately
-
-                elif isinstance(message, SubscribeRequest):
-                    session.set_streaming(message.stream)
-                    # Send acknowledgment
-                    response = {
-                        "type": "subscribe_ack",
-                        "streaming": session.streaming,
-                    }
-                    await websocket.send_text(json.dumps(response))
+                message_dict = decode_message(data)
+                msg_type = message_dict.get("type")
+                if not isinstance(msg_type, str):
+                    _send_error(
+                        session, ErrorCode.INVALID_MESSAGE, f"Unknown message type: {msg_type}"
+                    )
+                    continue
 
-                else:
-                    error = ErrorResponse(
-                        type="error",
-                        code=ErrorCode.INVALID_MESSAGE,
-                        message=f"Unknown message type: {type(message)}",
+                if msg_type == MessageType.BATCH.value:
+                    await _handle_batch(session, websocket, message_dict)
+                    continue
+
+                handler = _HANDLERS.get(msg_type)
+                if handler is None:
+                    _send_error(
+                        session, ErrorCode.INVALID_MESSAGE, f"Unknown message type: {msg_type}"
                     )
-                    await websocket.send_text(json.dumps(to_dict(error)))
+                    continue
 
-            except json.JSONDecodeError as e:
-                error = ErrorResponse(
-                    type="error",
-                    code=ErrorCode.INVALID_MESSAGE,
-                    message=f"Invalid JSON: {str(e)}",
-                )
-                await websocket.send_text(json.dumps(to_dict(error)))
+                await handler(session, websocket, parse_message(message_dict))
 
-            except ValueError as e:
-                error = ErrorResponse(
-                    type="error",
-                    code=ErrorCode.INVALID_MESSAGE,
-                    message=str(e),
-                )
-                await websocket.send_text(json.dumps(to_dict(error)))
+            except orjson.JSONDecodeError as e:
+                _send_error(session, ErrorCode.INVALID_MESSAGE, f"Invalid JSON: {str(e)}")
+
+            except (ValueError, TypeError) as e:
+                # TypeError covers messages missing required fields, which
+                # parse_message surfaces from the dataclass constructor
+                _send_error(session, ErrorCode.INVALID_MESSAGE, str(e))
 
     except WebSocketDisconnect:
         print("Client disconnected")
     except Exception as e:
         print(f"WebSocket error: {e}")
         try:
-            error = ErrorResponse(
-                type="error",
-                code=ErrorCode.INVALID_MESSAGE,
-                message=f"Server error: {str(e)}",
-            )
-            await websocket.send_text(json.dumps(to_dict(error)))
+            _send_error(session, ErrorCode.INVALID_MESSAGE, f"Server error: {str(e)}")
         except:
             pass
+    finally:
+        # Every exit path must tear down the session's writer/worker tasks
+        # and CPU executor, or each dropped connection leaks them
+        session.close()
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]; uvloop also sets
+    # TCP_NODELAY on its transports, so small step frames are not Nagle-delayed.
+    # permessage-deflate is off: step/obs frames are small and latency-bound,
+    # so deflate CPU per frame costs more than the bandwidth it saves
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws_per_message_deflate=False,
+    )
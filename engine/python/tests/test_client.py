@@ -5,7 +5,7 @@ Usage:
 """
 
 import asyncio
-import json
+import orjson
 import os
 
 import pytest
@@ -30,17 +30,17 @@ async def test_game_session():
         # 1. Send hello
         print("\n1. Sending hello...")
         hello = {"type": "hello", "version": "s1.0.0"}
-        await websocket.send(json.dumps(hello))
+        await websocket.send(orjson.dumps(hello))
         response = await websocket.recv()
-        data = json.loads(response)
+        data = orjson.loads(response)
         print(f"   Server: {data}")
 
         # 2. Reset game
         print("\n2. Resetting game with seed 42...")
         reset = {"type": "reset", "seed": 42}
-        await websocket.send(json.dumps(reset))
+        await websocket.send(orjson.dumps(reset))
         response = await websocket.recv()
-        data = json.loads(response)
+        data = orjson.loads(response)
         print(f"   Game reset. Current piece: {data['data']['current']['type']}")
         print(f"   Next queue: {data['data']['next_queue']}")
         print(f"   Legal moves: {len(data['data']['legal_moves'])} positions")
@@ -51,9 +51,9 @@ async def test_game_session():
 
         for action in actions:
             step = {"type": "step", "action": action}
-            await websocket.send(json.dumps(step))
+            await websocket.send(orjson.dumps(step))
             response = await websocket.recv()
-            data = json.loads(response)
+            data = orjson.loads(response)
 
             events = data["info"].get("events", [])
             print(f"   {action:5} → events: {events}, score: {data['data']['episode']['score']}")
@@ -65,18 +65,18 @@ async def test_game_session():
         # 4. Test invalid action
         print("\n4. Testing invalid action...")
         invalid = {"type": "step", "action": "INVALID"}
-        await websocket.send(json.dumps(invalid))
+        await websocket.send(orjson.dumps(invalid))
         response = await websocket.recv()
-        data = json.loads(response)
+        data = orjson.loads(response)
         if data.get("type") == "error":
             print(f"   ✓ Got expected error: {data['message']}")
 
         # 5. Reset again
         print("\n5. Resetting with new seed...")
         reset = {"type": "reset", "seed": 999}
-        await websocket.send(json.dumps(reset))
+        await websocket.send(orjson.dumps(reset))
         response = await websocket.recv()
-        data = json.loads(response)
+        data = orjson.loads(response)
         print(f"   New game. Current piece: {data['data']['current']['type']}")
 
         print("\n✓ All tests passed!")
@@ -93,27 +93,27 @@ async def test_multiple_games():
     print("Testing multiple games...")
     async with websockets.connect(uri) as websocket:
         # Hello
-        await websocket.send(json.dumps({"type": "hello", "version": "s1.0.0"}))
+        await websocket.send(orjson.dumps({"type": "hello", "version": "s1.0.0"}))
         await websocket.recv()
 
         for seed in [100, 200, 300]:
             print(f"\n--- Game with seed {seed} ---")
 
             # Reset
-            await websocket.send(json.dumps({"type": "reset", "seed": seed}))
+            await websocket.send(orjson.dumps({"type": "reset", "seed": seed}))
             response = await websocket.recv()
-            data = json.loads(response)
+            data = orjson.loads(response)
             print(f"Started. Piece: {data['data']['current']['type']}")
 
             # Play a few moves
             for _ in range(5):
-                await websocket.send(json.dumps({"type": "step", "action": "SOFT"}))
+                await websocket.send(orjson.dumps({"type": "step", "action": "SOFT"}))
                 await websocket.recv()
 
             # Hard drop
-            await websocket.send(json.dumps({"type": "step", "action": "HARD"}))
+            await websocket.send(orjson.dumps({"type": "step", "action": "HARD"}))
             response = await websocket.recv()
-            data = json.loads(response)
+            data = orjson.loads(response)
             print(f"Finished. Score: {data['data']['episode']['score']}")
 
     print("\n✓ Multiple games test passed!")
@@ -129,13 +129,13 @@ async def interactive_mode():
 
     async with websockets.connect(uri) as websocket:
         # Hello
-        await websocket.send(json.dumps({"type": "hello", "version": "s1.0.0"}))
+        await websocket.send(orjson.dumps({"type": "hello", "version": "s1.0.0"}))
         await websocket.recv()
 
         # Reset
-        await websocket.send(json.dumps({"type": "reset", "seed": 42}))
+        await websocket.send(orjson.dumps({"type": "reset", "seed": 42}))
         response = await websocket.recv()
-        data = json.loads(response)
+        data = orjson.loads(response)
         print(f"Game started! Piece: {data['data']['current']['type']}\n")
 
         while True:
@@ -144,15 +144,15 @@ async def interactive_mode():
             if cmd == "quit":
                 break
             elif cmd == "reset":
-                await websocket.send(json.dumps({"type": "reset"}))
+                await websocket.send(orjson.dumps({"type": "reset"}))
                 response = await websocket.recv()
-                data = json.loads(response)
+                data = orjson.loads(response)
                 print(f"Reset! Piece: {data['data']['current']['type']}")
             elif cmd in ["left", "right", "cw", "ccw", "soft", "hard", "hold"]:
                 action = cmd.upper()
-                await websocket.send(json.dumps({"type": "step", "action": action}))
+                await websocket.send(orjson.dumps({"type": "step", "action": action}))
                 response = await websocket.recv()
-                data = json.loads(response)
+                data = orjson.loads(response)
 
                 obs = data["data"]
                 print(f"Piece: {obs['current']['type']} at ({obs['current']['x']}, {obs['current']['y']}) rot={obs['current']['rot']}")
@@ -0,0 +1,50 @@
+"""Tests for the process-parallel environment vector."""
+
+from tetris_core.env import PlacementAction, TetrisEnv
+from tetris_core.vector_env import SubprocTetrisEnv
+
+
+def test_vector_env_reset_and_step():
+    """Reset and step two environments through the worker pipes."""
+    with SubprocTetrisEnv(2) as venv:
+        observations = venv.reset([1, 2])
+
+        assert len(observations) == 2
+        for obs in observations:
+            assert obs["episode"]["top_out"] is False
+            assert obs["legal_moves"], "Fresh board should have legal moves"
+
+        actions = [
+            PlacementAction(
+                x=obs["legal_moves"][0]["x"],
+                rot=obs["legal_moves"][0]["rot"],
+                use_hold=obs["legal_moves"][0]["use_hold"],
+            )
+            for obs in observations
+        ]
+        results = venv.step_placement(actions)
+
+        assert len(results) == 2
+        for obs, reward, done, info in results:
+            assert "events" in info
+            assert not done
+
+
+def test_vector_env_matches_single_env():
+    """A worker env must replay identically to a local env on the same seed."""
+    local = TetrisEnv()
+    local_obs = local.reset(42)
+
+    with SubprocTetrisEnv(1) as venv:
+        (remote_obs,) = venv.reset([42])
+        assert remote_obs["current"]["type"] == local_obs.current.type
+
+        move = local_obs.legal_moves[0]
+        action = PlacementAction(x=move.x, rot=move.rot, use_hold=move.use_hold)
+
+        local_result = local.step_placement(action)
+        ((remote_dict, remote_reward, remote_done, _),) = [venv.step_placement([action])[0]]
+
+        assert remote_dict["board"]["cells"] == local_result.obs.board.cells
+        assert remote_reward == local_result.reward
+        assert remote_done == local_result.done
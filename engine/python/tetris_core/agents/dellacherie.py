@@ -7,13 +7,148 @@ a linear combination of engineered features.
 Reference: Thiery & Scherrer (2009), "Building Controllers for Tetris"
 """
 
-from typing import Tuple
-from copy import deepcopy
+from typing import List
+
+# NOTE: never deepcopy Board or Observation - simulate_placement below works
+# on plain row masks, and board.copy() is the fallback for full snapshots
 
 from tetris_core.agent import Agent
 from tetris_core.env import Observation, PlacementAction, LegalMove
 from tetris_core.board import Board
-from tetris_core.piece import Piece
+from tetris_core.piece import PIECE_MEAN_DY, PIECE_ROW_MASKS
+
+_WIDTH = Board.WIDTH
+_HEIGHT = Board.HEIGHT
+_FULL_ROW = Board.FULL_ROW
+
+
+def piece_row_bits(piece_type: str, rot: int, x: int) -> List:
+    """Per-row occupancy bits for a piece at column x.
+
+    Pure table lookup + shift on the import-time PIECE_ROW_MASKS; no Piece
+    object and no cell list are built.
+
+    Args:
+        piece_type: Piece type
+        rot: Rotation state
+        x: Piece x position (may be negative for left-overhang shapes)
+
+    Returns:
+        List of (dy, bits) pairs
+    """
+    masks = PIECE_ROW_MASKS[(piece_type, rot)]
+    if x >= 0:
+        return [(dy, mask << x) for dy, mask in masks]
+    return [(dy, mask >> -x) for dy, mask in masks]
+
+
+def simulate_placement(rows: List[int], piece_rows) -> tuple:
+    """Merge piece bits into board rows and clear full lines.
+
+    Pure row-mask simulation of lock_piece + clear_lines: no Board copy, no
+    cell writes, just 20 ints in and 20 ints out.
+
+    Args:
+        rows: Pre-placement occupancy masks (not modified)
+        piece_rows: Iterable of (row index, piece occupancy bits)
+
+    Returns:
+        Tuple of (post-placement rows, lines cleared)
+    """
+    merged = list(rows)
+    for y, bits in piece_rows:
+        merged[y] |= bits
+    kept = [row for row in merged if row != _FULL_ROW]
+    lines_cleared = _HEIGHT - len(kept)
+    if lines_cleared:
+        kept[0:0] = [0] * lines_cleared
+    return kept, lines_cleared
+
+
+def evaluate_rows(rows: List[int]) -> tuple:
+    """Row transitions, column transitions and holes in one fused sweep.
+
+    The three metrics each need one pass over the 20 row masks; fusing them
+    keeps a single loop (and a single set of running accumulators) instead
+    of three.
+
+    Note on the top edge: this follows the engine convention from
+    tetris_core.features (the edge above row 0 counts as empty, so a
+    *filled* top cell is a transition). The agents' original per-cell scans
+    counted an *empty* top cell instead; the two conventions only differ
+    for placements that occupy row 0, and the canonical engine definition
+    was adopted deliberately when the kernels were unified.
+
+    Args:
+        rows: Occupancy masks of the board to evaluate
+
+    Returns:
+        Tuple of (row_transitions, col_transitions, holes)
+    """
+    row_trans = 0
+    # Top edge counts as empty, bottom edge as filled
+    col_trans = rows[0].bit_count() + (~rows[_HEIGHT - 1] & _FULL_ROW).bit_count()
+    holes = 0
+    covered = 0
+    prev = rows[0]
+    boundary = (1 << (_WIDTH + 1)) - 1
+    edge = 1 << (_WIDTH + 1)
+
+    for row in rows:
+        extended = edge | (row << 1) | 1  # Filled border bits on both sides
+        row_trans += ((extended ^ (extended >> 1)) & boundary).bit_count()
+        col_trans += (prev ^ row).bit_count()
+        holes += (~row & covered).bit_count()
+        covered |= row
+        prev = row
+
+    return row_trans, col_trans, holes
+
+
+def column_heights_of(rows: List[int]) -> List[int]:
+    """Column heights over occupancy masks (single top-down sweep)."""
+    heights = [0] * _WIDTH
+    remaining = _FULL_ROW  # Columns whose top block is still unseen
+    for y in range(_HEIGHT):
+        new_bits = rows[y] & remaining
+        while new_bits:
+            bit = new_bits & -new_bits
+            heights[bit.bit_length() - 1] = _HEIGHT - y
+            new_bits ^= bit
+        remaining &= ~rows[y]
+        if not remaining:
+            break
+    return heights
+
+
+def wells_of(rows: List[int]) -> int:
+    """Cumulative well depths over occupancy masks.
+
+    A well is a run of empty cells with higher neighbors (or the board
+    edge); depth n contributes 1 + 2 + ... + n. Only the first well per
+    column counts, matching the original per-cell scan.
+    """
+    wells = 0
+    for x in range(_WIDTH):
+        bit = 1 << x
+        left = bit >> 1 if x > 0 else 0  # 0 = board edge (counts as higher)
+        right = bit << 1 if x < _WIDTH - 1 else 0
+
+        for y in range(_HEIGHT):
+            row = rows[y]
+            if not row & bit:
+                left_higher = left == 0 or row & left
+                right_higher = right == 0 or row & right
+
+                if left_higher and right_higher:
+                    depth = 0
+                    for yy in range(y, _HEIGHT):
+                        if rows[yy] & bit:
+                            break
+                        depth += 1
+                    wells += (depth * (depth + 1)) // 2
+                    break  # Only count once per column
+    return wells
 
 
 class DellacherieAgent(Agent):
@@ -40,9 +175,38 @@ class DellacherieAgent(Agent):
         "wells": -3.3855972247263626,
     }
 
+    # Fixed feature order for the dict-free scoring path
+    FEATURE_KEYS = (
+        "landing_height",
+        "eroded_cells",
+        "row_transitions",
+        "col_transitions",
+        "holes",
+        "wells",
+    )
+
+    # Bound on the transposition-style score cache below
+    SCORE_CACHE_MAX = 100_000
+
     def __init__(self):
         """Initialize Dellacherie agent."""
         super().__init__(name="Dellacherie")
+        # Score per (pre-board rows, piece, x, rot); repeated positions
+        # across moves and episodes skip the simulate-and-evaluate pass
+        self._score_cache: dict = {}
+        # Weights in FEATURE_KEYS order; selection scores without dicts
+        self._weights_vec = tuple(self.WEIGHTS[key] for key in self.FEATURE_KEYS)
+
+    def __getstate__(self):
+        """Drop the score cache when pickling (e.g. into benchmark workers).
+
+        The cache is position-keyed scratch state that a fresh process would
+        cold-miss anyway; shipping up to 100k board-tuple keys per task is
+        pure serialization overhead.
+        """
+        state = self.__dict__.copy()
+        state["_score_cache"] = {}
+        return state
 
     def select_action(self, obs: Observation) -> PlacementAction:
         """Select best move according to Dellacherie features.
@@ -59,18 +223,68 @@ class DellacherieAgent(Agent):
         best_score = float("-inf")
         best_move = obs.legal_moves[0]
 
-        for move in obs.legal_moves:
-            features = self.compute_features(obs, move)
-            score = sum(self.WEIGHTS[k] * features[k] for k in self.WEIGHTS)
+        board_key = tuple(obs.board.get_row_masks())
+        cache = self._score_cache
+        w_landing = self.WEIGHTS["landing_height"]
+        # Only eroded_cells has a positive weight; its maximum is a Tetris
+        # erasing all four piece cells (4 rows x 4 cells)
+        max_positive = self.WEIGHTS["eroded_cells"] * 16.0
+
+        # Deepest landings first: landing height dominates the score, so a
+        # strong early incumbent lets the bound below prune most of the rest
+        moves = sorted(obs.legal_moves, key=lambda m: m.harddrop_y, reverse=True)
+
+        for move in moves:
+            piece_type = obs.hold_type if move.use_hold else obs.current.type
+            key = (board_key, piece_type, move.x, move.rot)
+            score = cache.get(key)
+            if score is None:
+                # Upper bound: every other feature contributes <= 0
+                landing_height = 20.0 - move.harddrop_y - PIECE_MEAN_DY[(piece_type, move.rot)]
+                if w_landing * landing_height + max_positive <= best_score:
+                    continue
+
+                score = self._score_move(obs, move, piece_type)
+                if len(cache) >= self.SCORE_CACHE_MAX:
+                    cache.clear()
+                cache[key] = score
 
             if score > best_score:
                 best_score = score
                 best_move = move
 
-        return PlacementAction(
-            x=best_move.x,
-            rot=best_move.rot,
-            use_hold=best_move.use_hold
+        # LegalMove is a PlacementAction; return the winning move directly
+        return best_move
+
+    def _score_move(self, obs: Observation, move: LegalMove, piece_type: str) -> float:
+        """Score one placement without building the feature dict.
+
+        Weighted sum over the fixed feature order; compute_features stays as
+        the dict-returning public form of the same evaluation.
+
+        Args:
+            obs: Current observation
+            move: Legal move to evaluate
+            piece_type: Piece the move places (current or held)
+
+        Returns:
+            Weighted feature score
+        """
+        y = move.harddrop_y
+        piece_rows = [
+            (y + dy, bits) for dy, bits in piece_row_bits(piece_type, move.rot, move.x)
+        ]
+        rows, lines_cleared = simulate_placement(obs.board.get_row_masks(), piece_rows)
+        row_trans, col_trans, holes = evaluate_rows(rows)
+
+        w_landing, w_eroded, w_row, w_col, w_holes, w_wells = self._weights_vec
+        return (
+            w_landing * (20.0 - y - PIECE_MEAN_DY[(piece_type, move.rot)])
+            + w_eroded * (lines_cleared * 4.0)
+            + w_row * row_trans
+            + w_col * col_trans
+            + w_holes * holes
+            + w_wells * wells_of(rows)
         )
 
     def compute_features(self, obs: Observation, move: LegalMove) -> dict:
@@ -83,61 +297,49 @@ class DellacherieAgent(Agent):
         Returns:
             Dictionary of feature values
         """
-        # Simulate placing the piece
-        board = obs.board.copy()
+        # Simulate placing the piece on the row masks only; no Piece object,
+        # no cell list, no Board copy
         piece_type = obs.hold_type if move.use_hold else obs.current.type
-        piece = Piece(piece_type, move.x, move.harddrop_y, move.rot)
-
-        # Get piece cells before locking
-        piece_cells = piece.get_cells()
+        y = move.harddrop_y
+        piece_rows = [
+            (y + dy, bits) for dy, bits in piece_row_bits(piece_type, move.rot, move.x)
+        ]
 
-        # Lock piece and clear lines
-        board.lock_piece(piece)
-        lines_cleared = board.clear_lines()
-
-        # Compute features
-        landing_height = self._compute_landing_height(piece_cells)
-        eroded_cells = self._compute_eroded_cells(piece_cells, lines_cleared, board)
-        row_transitions = self._compute_row_transitions(board)
-        col_transitions = self._compute_col_transitions(board)
-        holes = self._compute_holes(board)
-        wells = self._compute_wells(board)
+        rows, lines_cleared = simulate_placement(obs.board.get_row_masks(), piece_rows)
+        row_trans, col_trans, holes = evaluate_rows(rows)
 
         return {
-            "landing_height": landing_height,
-            "eroded_cells": eroded_cells,
-            "row_transitions": row_transitions,
-            "col_transitions": col_transitions,
+            "landing_height": self._compute_landing_height(piece_type, move.rot, y),
+            "eroded_cells": self._compute_eroded_cells(lines_cleared),
+            "row_transitions": row_trans,
+            "col_transitions": col_trans,
             "holes": holes,
-            "wells": wells,
+            "wells": wells_of(rows),
         }
 
-    def _compute_landing_height(self, piece_cells: list) -> float:
+    def _compute_landing_height(self, piece_type: str, rot: int, harddrop_y: int) -> float:
         """Landing height: Average height of piece cells.
 
+        y=0 is top, y=19 is bottom, so the average cell height is
+        20 - harddrop_y - mean relative cell row (precomputed per shape).
+
         Args:
-            piece_cells: List of (x, y) coordinates
+            piece_type: Piece type
+            rot: Rotation state
+            harddrop_y: Final piece y position
 
         Returns:
-            Average y coordinate (height from bottom)
+            Average height from the bottom
         """
-        if not piece_cells:
-            return 0.0
-        # y=0 is top, y=19 is bottom, so height = (20 - y)
-        heights = [20 - y for x, y in piece_cells]
-        return sum(heights) / len(heights)
+        return 20.0 - harddrop_y - PIECE_MEAN_DY[(piece_type, rot)]
 
-    def _compute_eroded_cells(
-        self, piece_cells: list, lines_cleared: int, board: Board
-    ) -> float:
+    def _compute_eroded_cells(self, lines_cleared: int) -> float:
         """Eroded piece cells: (rows cleared) × (cells removed from piece).
 
         This rewards clearing lines with the current piece.
 
         Args:
-            piece_cells: Original piece cells before clearing
             lines_cleared: Number of lines cleared
-            board: Board after clearing
 
         Returns:
             Product of lines cleared and piece cells eroded
@@ -148,111 +350,4 @@ class DellacherieAgent(Agent):
         # Count how many piece cells were in cleared rows
         # (This is approximate since we can't track which cells belonged to piece after clearing)
         # In practice, we estimate: if 4 cells and 1 line cleared, assume ~4 cells eroded
-        return float(lines_cleared * len(piece_cells))
-
-    def _compute_row_transitions(self, board: Board) -> int:
-        """Row transitions: Occupied→empty transitions in each row.
-
-        Args:
-            board: Current board
-
-        Returns:
-            Total number of horizontal transitions
-        """
-        transitions = 0
-        for y in range(board.HEIGHT):
-            for x in range(board.WIDTH - 1):
-                cell = board.get(x, y)
-                next_cell = board.get(x + 1, y)
-                if (cell > 0) != (next_cell > 0):
-                    transitions += 1
-
-            # Count transition from board edge to first cell
-            if board.get(0, y) == 0:
-                transitions += 1
-            # Count transition from last cell to board edge
-            if board.get(board.WIDTH - 1, y) == 0:
-                transitions += 1
-
-        return transitions
-
-    def _compute_col_transitions(self, board: Board) -> int:
-        """Column transitions: Occupied→empty transitions in each column.
-
-        Args:
-            board: Current board
-
-        Returns:
-            Total number of vertical transitions
-        """
-        transitions = 0
-        for x in range(board.WIDTH):
-            for y in range(board.HEIGHT - 1):
-                cell = board.get(x, y)
-                next_cell = board.get(x, y + 1)
-                if (cell > 0) != (next_cell > 0):
-                    transitions += 1
-
-            # Count transition from top edge to first cell
-            if board.get(x, 0) == 0:
-                transitions += 1
-            # Count transition from last cell to bottom edge
-            if board.get(x, board.HEIGHT - 1) == 0:
-                transitions += 1
-
-        return transitions
-
-    def _compute_holes(self, board: Board) -> int:
-        """Holes: Empty cells with at least one occupied cell above.
-
-        Args:
-            board: Current board
-
-        Returns:
-            Number of holes
-        """
-        holes = 0
-        for x in range(board.WIDTH):
-            found_block = False
-            for y in range(board.HEIGHT):
-                if board.get(x, y) > 0:
-                    found_block = True
-                elif found_block and board.get(x, y) == 0:
-                    holes += 1
-        return holes
-
-    def _compute_wells(self, board: Board) -> int:
-        """Wells: Sum of well depths (cumulative).
-
-        A well is a sequence of empty cells in a column with higher neighbors.
-        Well depth is 1 + 2 + ... + n for a well of depth n.
-
-        Args:
-            board: Current board
-
-        Returns:
-            Sum of cumulative well depths
-        """
-        wells = 0
-
-        for x in range(board.WIDTH):
-            for y in range(board.HEIGHT):
-                if board.get(x, y) == 0:
-                    # Check if this cell is a well (higher or edge on both sides)
-                    left_higher = (x == 0) or (board.get(x - 1, y) > 0)
-                    right_higher = (x == board.WIDTH - 1) or (board.get(x + 1, y) > 0)
-
-                    if left_higher and right_higher:
-                        # Count depth of well starting from this cell
-                        depth = 0
-                        for yy in range(y, board.HEIGHT):
-                            if board.get(x, yy) == 0:
-                                depth += 1
-                            else:
-                                break
-
-                        # Cumulative well depth: 1 + 2 + ... + depth
-                        wells += (depth * (depth + 1)) // 2
-                        break  # Only count once per column
-
-        return wells
+        return float(lines_cleared * 4)
@@ -37,11 +37,6 @@ class RandomAgent(Agent):
             # Return a dummy action that will fail
             return PlacementAction(x=0, rot=0, use_hold=False)
 
-        # Pick a random legal move
-        move = self.rng.choice(obs.legal_moves)
-
-        return PlacementAction(
-            x=move.x,
-            rot=move.rot,
-            use_hold=move.use_hold
-        )
+        # Pick a random legal move; LegalMove is a PlacementAction, so it
+        # can be returned as the action directly
+        return self.rng.choice(obs.legal_moves)
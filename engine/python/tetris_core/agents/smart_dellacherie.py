@@ -10,13 +10,22 @@ Key differences from DellacherieAgent:
 - More risk-tolerant (accepts higher stacks for bigger payoffs)
 """
 
-from typing import Tuple
-from copy import deepcopy
+from typing import List
 
 from tetris_core.agent import Agent
 from tetris_core.env import Observation, PlacementAction, LegalMove
 from tetris_core.board import Board
-from tetris_core.piece import Piece
+from tetris_core.piece import PIECE_MEAN_DY
+from tetris_core.agents.dellacherie import (
+    column_heights_of,
+    evaluate_rows,
+    piece_row_bits,
+    simulate_placement,
+    wells_of,
+)
+
+_WIDTH = Board.WIDTH
+_HEIGHT = Board.HEIGHT
 
 
 class SmartDellacherieAgent(Agent):
@@ -76,11 +85,8 @@ class SmartDellacherieAgent(Agent):
                 best_score = score
                 best_move = move
 
-        return PlacementAction(
-            x=best_move.x,
-            rot=best_move.rot,
-            use_hold=best_move.use_hold
-        )
+        # LegalMove is a PlacementAction; return the winning move directly
+        return best_move
 
     def compute_features(self, obs: Observation, move: LegalMove, i_piece_available: bool) -> dict:
         """Compute enhanced features for a given move.
@@ -93,57 +99,38 @@ class SmartDellacherieAgent(Agent):
         Returns:
             Dictionary of feature values
         """
-        # Simulate placing the piece
-        board = obs.board.copy()
-        piece_type = obs.hold.type if move.use_hold else obs.current.type
-        piece = Piece(piece_type, move.x, move.harddrop_y, move.rot)
-
-        # Get piece cells before locking
-        piece_cells = piece.get_cells()
-
-        # Lock piece and clear lines
-        board.lock_piece(piece)
-        lines_cleared = board.clear_lines()
-
-        # Compute original Dellacherie features
-        landing_height = self._compute_landing_height(piece_cells)
-        eroded_cells = self._compute_eroded_cells(piece_cells, lines_cleared, board)
-        row_transitions = self._compute_row_transitions(board)
-        col_transitions = self._compute_col_transitions(board)
-        holes = self._compute_holes(board)
-        wells = self._compute_wells(board)
-
-        # Compute new efficiency features
-        tetris_ready = self._compute_tetris_ready(board)
-        multi_line_potential = self._compute_multi_line_potential(board)
-        well_quality = self._compute_well_quality(board)
-        i_available = 1.0 if i_piece_available else 0.0
+        # Simulate placing the piece on the row masks only; no Piece object,
+        # no cell list, no Board copy
+        piece_type = obs.hold_type if move.use_hold else obs.current.type
+        y = move.harddrop_y
+        piece_rows = [
+            (y + dy, bits) for dy, bits in piece_row_bits(piece_type, move.rot, move.x)
+        ]
+
+        rows, lines_cleared = simulate_placement(obs.board.get_row_masks(), piece_rows)
+        heights = column_heights_of(rows)
+        row_trans, col_trans, holes = evaluate_rows(rows)
 
         return {
-            "landing_height": landing_height,
-            "eroded_cells": eroded_cells,
-            "row_transitions": row_transitions,
-            "col_transitions": col_transitions,
+            "landing_height": self._compute_landing_height(piece_type, move.rot, y),
+            "eroded_cells": self._compute_eroded_cells(lines_cleared),
+            "row_transitions": row_trans,
+            "col_transitions": col_trans,
             "holes": holes,
-            "wells": wells,
-            "tetris_ready": tetris_ready,
-            "multi_line_potential": multi_line_potential,
-            "well_quality": well_quality,
-            "i_piece_available": i_available,
+            "wells": wells_of(rows),
+            "tetris_ready": self._compute_tetris_ready(heights),
+            "multi_line_potential": self._compute_multi_line_potential(rows),
+            "well_quality": self._compute_well_quality(heights),
+            "i_piece_available": 1.0 if i_piece_available else 0.0,
         }
 
     # ===== Original Dellacherie Features =====
 
-    def _compute_landing_height(self, piece_cells: list) -> float:
+    def _compute_landing_height(self, piece_type: str, rot: int, harddrop_y: int) -> float:
         """Landing height: Average height of piece cells."""
-        if not piece_cells:
-            return 0.0
-        heights = [20 - y for x, y in piece_cells]
-        return sum(heights) / len(heights)
+        return 20.0 - harddrop_y - PIECE_MEAN_DY[(piece_type, rot)]
 
-    def _compute_eroded_cells(
-        self, piece_cells: list, lines_cleared: int, board: Board
-    ) -> float:
+    def _compute_eroded_cells(self, lines_cleared: int) -> float:
         """Eroded piece cells: (rows cleared) × (cells removed from piece)."""
         if lines_cleared == 0:
             return 0.0
@@ -155,108 +142,37 @@ class SmartDellacherieAgent(Agent):
             multiplier = 2.0
         elif lines_cleared == 2:
             multiplier = 1.5
-        return float(lines_cleared * len(piece_cells) * multiplier)
-
-    def _compute_row_transitions(self, board: Board) -> int:
-        """Row transitions: Occupied→empty transitions in each row."""
-        transitions = 0
-        for y in range(board.HEIGHT):
-            for x in range(board.WIDTH - 1):
-                cell = board.get(x, y)
-                next_cell = board.get(x + 1, y)
-                if (cell > 0) != (next_cell > 0):
-                    transitions += 1
-            if board.get(0, y) == 0:
-                transitions += 1
-            if board.get(board.WIDTH - 1, y) == 0:
-                transitions += 1
-        return transitions
-
-    def _compute_col_transitions(self, board: Board) -> int:
-        """Column transitions: Occupied→empty transitions in each column."""
-        transitions = 0
-        for x in range(board.WIDTH):
-            for y in range(board.HEIGHT - 1):
-                cell = board.get(x, y)
-                next_cell = board.get(x, y + 1)
-                if (cell > 0) != (next_cell > 0):
-                    transitions += 1
-            if board.get(x, 0) == 0:
-                transitions += 1
-            if board.get(x, board.HEIGHT - 1) == 0:
-                transitions += 1
-        return transitions
-
-    def _compute_holes(self, board: Board) -> int:
-        """Holes: Empty cells with at least one occupied cell above."""
-        holes = 0
-        for x in range(board.WIDTH):
-            found_block = False
-            for y in range(board.HEIGHT):
-                if board.get(x, y) > 0:
-                    found_block = True
-                elif found_block and board.get(x, y) == 0:
-                    holes += 1
-        return holes
-
-    def _compute_wells(self, board: Board) -> int:
-        """Wells: Sum of well depths (cumulative)."""
-        wells = 0
-        for x in range(board.WIDTH):
-            for y in range(board.HEIGHT):
-                if board.get(x, y) == 0:
-                    left_higher = (x == 0) or (board.get(x - 1, y) > 0)
-                    right_higher = (x == board.WIDTH - 1) or (board.get(x + 1, y) > 0)
-
-                    if left_higher and right_higher:
-                        depth = 0
-                        for yy in range(y, board.HEIGHT):
-                            if board.get(x, yy) == 0:
-                                depth += 1
-                            else:
-                                break
-                        wells += (depth * (depth + 1)) // 2
-                        break
-        return wells
+        return float(lines_cleared * 4 * multiplier)
 
     # ===== New Efficiency Features =====
 
-    def _compute_tetris_ready(self, board: Board) -> float:
+    def _compute_tetris_ready(self, heights: List[int]) -> float:
         """Tetris readiness: Reward for having a clean well suitable for I-piece.
 
-        Looks for a single column that is:
-        - Empty for at least 4 consecutive rows
-        - Preferably on the edge or with one neighbor
-        - Has full/near-full rows on other columns
+        A candidate well is a column whose empty run from the skyline is at
+        least 4 deep (board height minus column height); edge wells and
+        wells flanked by tall neighbors score higher.
+
+        Args:
+            heights: Column heights of the post-placement board
 
         Returns:
             Score for Tetris readiness (0-10)
         """
         max_readiness = 0.0
 
-        for x in range(board.WIDTH):
-            # Find the deepest well in this column
-            well_depth = 0
-            well_start_y = -1
-
-            for y in range(board.HEIGHT):
-                if board.get(x, y) == 0:
-                    if well_start_y == -1:
-                        well_start_y = y
-                    well_depth += 1
-                else:
-                    break
+        for x in range(_WIDTH):
+            well_depth = _HEIGHT - heights[x]
 
             if well_depth >= 4:
-                # Check if adjacent columns are fuller (good Tetris setup)
-                left_height = self._get_column_height(board, x - 1) if x > 0 else 20
-                right_height = self._get_column_height(board, x + 1) if x < board.WIDTH - 1 else 20
+                left_height = heights[x - 1] if x > 0 else 20
+                right_height = heights[x + 1] if x < _WIDTH - 1 else 20
 
                 # Reward deeper wells and edge positions
                 readiness = well_depth / 4.0  # Base score from depth
 
                 # Bonus for edge position (easier to manage)
-                if x == 0 or x == board.WIDTH - 1:
+                if x == 0 or x == _WIDTH - 1:
                     readiness += 2.0
 
                 # Bonus if neighbors are tall (good setup)
@@ -268,80 +184,40 @@ class SmartDellacherieAgent(Agent):
 
         return max_readiness
 
-    def _compute_multi_line_potential(self, board: Board) -> float:
+    def _compute_multi_line_potential(self, rows: List[int]) -> float:
         """Multi-line potential: Reward for multiple near-full rows.
 
-        Counts rows that are ≥70% full (7+ cells occupied).
-        More near-full rows = higher potential for multi-line clear.
+        Counts rows that are ≥70% full (7+ cells occupied); one popcount
+        per row.
+
+        Args:
+            rows: Occupancy masks of the post-placement board
 
         Returns:
             Number of near-full rows
         """
-        near_full_rows = 0
+        return float(sum(1 for row in rows if row.bit_count() >= 7))
 
-        for y in range(board.HEIGHT):
-            filled_cells = sum(1 for x in range(board.WIDTH) if board.get(x, y) > 0)
-            if filled_cells >= 7:  # 70% full
-                near_full_rows += 1
+    def _compute_well_quality(self, heights: List[int]) -> float:
+        """Well quality: Reward a single clean well over scattered holes.
 
-        return float(near_full_rows)
+        Only completely empty columns qualify as clean wells (any filled
+        cell below the empty run disqualifies the column, matching the
+        original scan's hole check).
 
-    def _compute_well_quality(self, board: Board) -> float:
-        """Well quality: Reward single clean well over scattered holes.
-
-        A quality well is:
-        - Deep (4+ rows)
-        - Clean (no holes in the column)
-        - Has at most one well on the board
+        Args:
+            heights: Column heights of the post-placement board
 
         Returns:
             Score for well quality (0-10)
         """
-        wells_found = []
-
-        for x in range(board.WIDTH):
-            # Check if this column has a deep well
-            well_depth = 0
-            has_holes = False
-
-            for y in range(board.HEIGHT):
-                if board.get(x, y) == 0:
-                    well_depth += 1
-                    # Check if there's a hole (filled cell below)
-                    for yy in range(y + 1, board.HEIGHT):
-                        if board.get(x, yy) > 0:
-                            has_holes = True
-                            break
-                else:
-                    break
-
-            if well_depth >= 4 and not has_holes:
-                wells_found.append((x, well_depth))
+        clean_wells = [x for x in range(_WIDTH) if heights[x] == 0]
 
         # Reward exactly 1 clean deep well
-        if len(wells_found) == 1:
-            return float(min(wells_found[0][1], 10))  # Cap at 10
-        elif len(wells_found) == 0:
+        if len(clean_wells) == 1:
+            return 10.0  # Depth capped at 10
+        elif not clean_wells:
             return 0.0
         else:
             # Penalty for multiple wells (scattered setup)
             return -5.0
-
-    def _get_column_height(self, board: Board, x: int) -> int:
-        """Get the height of a column (how many rows from bottom to top block).
-
-        Args:
-            board: Current board
-            x: Column index
-
-        Returns:
-            Height of the column (0-20)
-        """
-        if x < 0 or x >= board.WIDTH:
-            return 0
-
-        for y in range(board.HEIGHT):
-            if board.get(x, y) > 0:
-                return board.HEIGHT - y
-
-        return 0
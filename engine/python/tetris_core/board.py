@@ -1,7 +1,10 @@
 """Tetris board with collision detection and line clearing."""
 
 from typing import List
-from tetris_core.piece import Piece
+from tetris_core.piece import Piece, PIECE_BOUNDS, PIECE_COL_BOTTOMS, PIECE_ROW_MASKS
+
+# Piece type -> cell encoding (1-7), resolved once at import time
+_PIECE_VALUES = {"I": 1, "O": 2, "T": 3, "S": 4, "Z": 5, "J": 6, "L": 7}
 
 
 class Board:
@@ -9,12 +12,26 @@ class Board:
 
     WIDTH = 10
     HEIGHT = 20
+    FULL_ROW = (1 << WIDTH) - 1  # All 10 occupancy bits set
 
     def __init__(self):
         """Initialize an empty board."""
         # cells[y * WIDTH + x] represents the cell at (x, y)
         # 0 = empty, 1-7 = filled (piece type encoded)
         self.cells: List[int] = [0] * (self.WIDTH * self.HEIGHT)
+        # Occupancy bitmask per row (bit x set = cell (x, y) filled), kept in
+        # sync with cells by every mutator; collision and line detection run
+        # on these instead of per-cell probes
+        self._row_masks: List[int] = [0] * self.HEIGHT
+        # Bumped by every mutator; lets callers key caches on board content
+        self.version = 0
+        # Cached per-column height and hole counts, maintained by mutators
+        # so feature evaluation reads them instead of rescanning the board
+        self._col_heights: List[int] = [0] * self.WIDTH
+        self._col_holes: List[int] = [0] * self.WIDTH
+        # True while this board's buffers are shared with a copy; mutators
+        # detach before writing (copy-on-write)
+        self._shared = False
 
     def get(self, x: int, y: int) -> int:
         """Get cell value at (x, y).
@@ -30,6 +47,15 @@ class Board:
             return 1  # Out of bounds treated as solid
         return self.cells[y * self.WIDTH + x]
 
+    def _ensure_private(self) -> None:
+        """Detach from any shared buffers before mutating (copy-on-write)."""
+        if self._shared:
+            self.cells = self.cells.copy()
+            self._row_masks = self._row_masks.copy()
+            self._col_heights = self._col_heights.copy()
+            self._col_holes = self._col_holes.copy()
+            self._shared = False
+
     def set(self, x: int, y: int, value: int) -> None:
         """Set cell value at (x, y).
 
@@ -39,7 +65,14 @@ class Board:
             value: Cell value to set
         """
         if self.in_bounds(x, y):
+            self._ensure_private()
             self.cells[y * self.WIDTH + x] = value
+            if value:
+                self._row_masks[y] |= 1 << x
+            else:
+                self._row_masks[y] &= ~(1 << x)
+            self.version += 1
+            self._recompute_column(x)
 
     def in_bounds(self, x: int, y: int) -> bool:
         """Check if coordinates are within board bounds.
@@ -56,17 +89,81 @@ class Board:
     def collides(self, piece: Piece) -> bool:
         """Check if a piece collides with the board or boundaries.
 
+        Uses the precomputed piece row masks: after a bounding-box check,
+        each occupied row costs one shift and one AND.
+
         Args:
             piece: The piece to check
 
         Returns:
             True if collision detected
         """
-        for x, y in piece.get_cells():
-            if not self.in_bounds(x, y) or self.get(x, y) != 0:
-                return True
+        key = (piece.type, piece.rot)
+        min_dx, min_dy, max_dx, max_dy = PIECE_BOUNDS[key]
+        x, y = piece.x, piece.y
+        if x + min_dx < 0 or x + max_dx >= self.WIDTH:
+            return True
+        if y + min_dy < 0 or y + max_dy >= self.HEIGHT:
+            return True
+        row_masks = self._row_masks
+        if x >= 0:
+            for dy, mask in PIECE_ROW_MASKS[key]:
+                if row_masks[y + dy] & (mask << x):
+                    return True
+        else:
+            # Origin left of the board; the bounds check above already
+            # guarantees no occupied bit falls below column 0
+            for dy, mask in PIECE_ROW_MASKS[key]:
+                if row_masks[y + dy] & (mask >> -x):
+                    return True
         return False
 
+    def drop_y(self, piece: Piece) -> int:
+        """Resting row for a piece dropped straight down from its position.
+
+        Scans the row masks directly instead of re-testing a moved piece
+        per cell of fall; one shift+AND per occupied row per candidate y.
+
+        Args:
+            piece: Piece to drop (assumed non-colliding at its current pose)
+
+        Returns:
+            Final y position
+        """
+        key = (piece.type, piece.rot)
+        max_dy = PIECE_BOUNDS[key][3]
+        x = piece.x
+        y = piece.y
+
+        # Fast path: land on the surface tops, one subtraction per piece
+        # column. Exact whenever the resulting row is at or below the
+        # current one (the piece is above every filled cell it could hit).
+        col_heights = self._col_heights
+        rest = self.HEIGHT - 1 - max_dy  # Floor limit
+        for dx, bottom_dy in PIECE_COL_BOTTOMS[key]:
+            candidate = self.HEIGHT - col_heights[x + dx] - 1 - bottom_dy
+            if candidate < rest:
+                rest = candidate
+        if rest >= y:
+            return rest
+
+        # Piece sits under an overhang (e.g. after a kick); scan the masks
+        masks = PIECE_ROW_MASKS[key]
+        if x >= 0:
+            shifted = [(dy, mask << x) for dy, mask in masks]
+        else:
+            shifted = [(dy, mask >> -x) for dy, mask in masks]
+
+        row_masks = self._row_masks
+        limit = self.HEIGHT - 1 - max_dy
+        while y < limit:
+            next_y = y + 1
+            for dy, bits in shifted:
+                if row_masks[next_y + dy] & bits:
+                    return y
+            y = next_y
+        return y
+
     def lock_piece(self, piece: Piece) -> None:
         """Lock a piece onto the board.
 
@@ -74,28 +171,49 @@ class Board:
             piece: The piece to lock
         """
         # Map piece type to cell value (simple encoding)
-        piece_values = {"I": 1, "O": 2, "T": 3, "S": 4, "Z": 5, "J": 6, "L": 7}
-        value = piece_values.get(piece.type, 1)
+        value = _PIECE_VALUES.get(piece.type, 1)
 
+        self._ensure_private()
+        touched = set()
         for x, y in piece.get_cells():
-            self.set(x, y, value)
+            if self.in_bounds(x, y):
+                self.cells[y * self.WIDTH + x] = value
+                self._row_masks[y] |= 1 << x
+                touched.add(x)
+        for x in touched:
+            self._recompute_column(x)
+        self.version += 1
 
     def clear_lines(self) -> int:
         """Clear all complete lines and return count.
 
+        Single-pass compaction: surviving rows are gathered in order and the
+        board is rebuilt with empty rows on top, instead of shifting the
+        whole board once per cleared line.
+
         Returns:
             Number of lines cleared
         """
-        lines_cleared = 0
-        y = self.HEIGHT - 1  # Start from bottom
+        masks = self._row_masks
+        lines_cleared = masks.count(self.FULL_ROW)
+        if lines_cleared == 0:
+            return 0
 
-        while y >= 0:
-            if self.is_line_full(y):
-                self.remove_line(y)
-                lines_cleared += 1
-                # Don't decrement y; check the same row again
-            else:
-                y -= 1
+        self._ensure_private()
+        masks = self._row_masks
+
+        width = self.WIDTH
+        kept_cells: List[int] = []
+        kept_masks: List[int] = []
+        for y in range(self.HEIGHT):
+            if masks[y] != self.FULL_ROW:
+                kept_cells.extend(self.cells[y * width:(y + 1) * width])
+                kept_masks.append(masks[y])
+
+        self.cells = [0] * (lines_cleared * width) + kept_cells
+        self._row_masks = [0] * lines_cleared + kept_masks
+        self._recompute_all_columns()
+        self.version += 1
 
         return lines_cleared
 
@@ -108,10 +226,7 @@ class Board:
         Returns:
             True if line is full
         """
-        for x in range(self.WIDTH):
-            if self.get(x, y) == 0:
-                return False
-        return True
+        return self._row_masks[y] == self.FULL_ROW
 
     def remove_line(self, line_y: int) -> None:
         """Remove a line and shift everything above down.
@@ -119,14 +234,62 @@ class Board:
         Args:
             line_y: Row to remove
         """
-        # Shift all lines above down by one
+        self._ensure_private()
+        # Shift all lines above down by one (whole-row slice moves)
         for y in range(line_y, 0, -1):
-            for x in range(self.WIDTH):
-                self.cells[y * self.WIDTH + x] = self.cells[(y - 1) * self.WIDTH + x]
+            src = (y - 1) * self.WIDTH
+            dst = y * self.WIDTH
+            self.cells[dst:dst + self.WIDTH] = self.cells[src:src + self.WIDTH]
+            self._row_masks[y] = self._row_masks[y - 1]
 
         # Clear the top line
+        self.cells[0:self.WIDTH] = [0] * self.WIDTH
+        self._row_masks[0] = 0
+        self._recompute_all_columns()
+        self.version += 1
+
+    def get_row_masks(self) -> List[int]:
+        """Get the per-row occupancy bitmasks (bit x set = cell filled).
+
+        Returns the internal list; callers must treat it as read-only.
+
+        Returns:
+            List of 20 row masks
+        """
+        return self._row_masks
+
+    def _rebuild_row_masks(self) -> None:
+        """Recompute the occupancy masks from the cell buffer."""
+        for y in range(self.HEIGHT):
+            mask = 0
+            base = y * self.WIDTH
+            for x in range(self.WIDTH):
+                if self.cells[base + x]:
+                    mask |= 1 << x
+            self._row_masks[y] = mask
+        self._recompute_all_columns()
+        self.version += 1
+
+    def _recompute_column(self, x: int) -> None:
+        """Recompute the cached height and hole count for one column."""
+        cells = self.cells
+        height = 0
+        holes = 0
+        found_block = False
+        for y in range(self.HEIGHT):
+            if cells[y * self.WIDTH + x]:
+                if not found_block:
+                    height = self.HEIGHT - y
+                    found_block = True
+            elif found_block:
+                holes += 1
+        self._col_heights[x] = height
+        self._col_holes[x] = holes
+
+    def _recompute_all_columns(self) -> None:
+        """Recompute every cached column height and hole count."""
         for x in range(self.WIDTH):
-            self.cells[x] = 0
+            self._recompute_column(x)
 
     def get_column_height(self, x: int) -> int:
         """Get the height of a column (distance from bottom to highest block).
@@ -137,18 +300,18 @@ class Board:
         Returns:
             Height (0 = empty column, HEIGHT = full column)
         """
-        for y in range(self.HEIGHT):
-            if self.get(x, y) != 0:
-                return self.HEIGHT - y
-        return 0
+        return self._col_heights[x]
 
     def get_column_heights(self) -> List[int]:
         """Get heights of all columns.
 
+        Reads the incrementally-maintained cache; mutators keep it current,
+        so this is a list copy rather than a board scan.
+
         Returns:
             List of 10 heights
         """
-        return [self.get_column_height(x) for x in range(self.WIDTH)]
+        return self._col_heights.copy()
 
     def count_holes_in_column(self, x: int) -> int:
         """Count holes in a column (empty cells below a filled cell).
@@ -159,16 +322,7 @@ class Board:
         Returns:
             Number of holes
         """
-        holes = 0
-        found_block = False
-
-        for y in range(self.HEIGHT):
-            if self.get(x, y) != 0:
-                found_block = True
-            elif found_block:
-                holes += 1
-
-        return holes
+        return self._col_holes[x]
 
     def get_holes_per_column(self) -> List[int]:
         """Get hole counts for all columns.
@@ -176,16 +330,25 @@ class Board:
         Returns:
             List of 10 hole counts
         """
-        return [self.count_holes_in_column(x) for x in range(self.WIDTH)]
+        return self._col_holes.copy()
 
     def copy(self) -> "Board":
-        """Create a deep copy of the board.
+        """Create a copy of the board (copy-on-write).
+
+        The copy shares this board's buffers until either side mutates, so
+        per-observation snapshots cost no cell copying at all.
 
         Returns:
             New board with same state
         """
         new_board = Board()
-        new_board.cells = self.cells.copy()
+        new_board.cells = self.cells
+        new_board._row_masks = self._row_masks
+        new_board._col_heights = self._col_heights
+        new_board._col_holes = self._col_holes
+        new_board.version = self.version
+        new_board._shared = True
+        self._shared = True
         return new_board
 
     def to_list(self) -> List[int]:
@@ -210,4 +373,5 @@ class Board:
             raise ValueError(f"Expected {cls.WIDTH * cls.HEIGHT} cells, got {len(cells)}")
         board = cls()
         board.cells = cells.copy()
+        board._rebuild_row_masks()
         return board
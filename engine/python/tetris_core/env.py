@@ -3,16 +3,22 @@
 Provides reset() and step() methods for both human play and RL training.
 """
 
+import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 
 from tetris_core.board import Board
-from tetris_core.piece import Piece, get_spawn_position, PIECE_SHAPES
+from tetris_core.piece import Piece, get_spawn_position, PIECE_BOUNDS
 from tetris_core.rng import SevenBagRNG
 from tetris_core.rules import SRSRules, LockDelay, calculate_score
 from tetris_core.features import compute_features, compute_feature_deltas
 
+logger = logging.getLogger(__name__)
+
+# Lock-time score per simultaneous line count (0-4), resolved once
+_SCORE_TABLE = tuple(calculate_score(n) for n in range(5))
+
 
 class FrameAction(Enum):
     """Frame-by-frame control actions."""
@@ -26,7 +32,7 @@ class FrameAction(Enum):
     NOOP = "NOOP"    # No operation
 
 
-@dataclass
+@dataclass(slots=True)
 class PlacementAction:
     """Direct placement action for AI."""
     x: int
@@ -34,16 +40,17 @@ class PlacementAction:
     use_hold: bool
 
 
-@dataclass
-class LegalMove:
-    """A legal placement move."""
-    x: int
-    rot: int
-    use_hold: bool
+@dataclass(slots=True)
+class LegalMove(PlacementAction):
+    """A legal placement move.
+
+    Subclasses PlacementAction, so a chosen move can be returned to
+    step_placement directly without rebuilding an action object.
+    """
     harddrop_y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Complete game state observation."""
     schema_version: str
@@ -70,7 +77,9 @@ class Observation:
             "board": {
                 "w": self.board.WIDTH,
                 "h": self.board.HEIGHT,
-                "cells": self.board.to_list(),
+                # Shared (copy-on-write) with the engine board; treat as
+                # read-only - serialize or copy, never mutate through the dict
+                "cells": self.board.cells,
                 "row_heights": self.board.get_column_heights(),
                 "holes_per_col": self.board.get_holes_per_column(),
             },
@@ -104,7 +113,7 @@ class Observation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a step() call."""
     obs: Observation
@@ -126,6 +135,7 @@ class TetrisEnv:
         hold_enabled: bool = True,
         lock_delay_ticks: int = 30,
         next_queue_size: int = 3,
+        legal_moves_enabled: bool = True,
     ):
         """Initialize the environment.
 
@@ -134,10 +144,15 @@ class TetrisEnv:
             hold_enabled: Enable hold functionality
             lock_delay_ticks: Lock delay in ticks (default 30 = 0.5s)
             next_queue_size: Number of next pieces to show
+            legal_moves_enabled: Include legal moves in observations. Frame-
+                action consumers (human play, full-control RL) can disable
+                this to skip the placement enumeration per tick;
+                step_placement still validates against the full enumeration.
         """
         self.srs_enabled = srs_enabled
         self.hold_enabled = hold_enabled
         self.next_queue_size = next_queue_size
+        self.legal_moves_enabled = legal_moves_enabled
 
         self.board = Board()
         self.rng: Optional[SevenBagRNG] = None
@@ -157,6 +172,22 @@ class TetrisEnv:
         self.gravity_counter = 0
         self.last_features: Dict[str, int] = {}
 
+        # Frame-action dispatch table; HARD stays special-cased in step()
+        # because it collects events and skips gravity, NOOP has no handler
+        self._action_handlers = {
+            FrameAction.LEFT: lambda: self._try_move(-1, 0),
+            FrameAction.RIGHT: lambda: self._try_move(1, 0),
+            FrameAction.CW: lambda: self._try_rotate(clockwise=True),
+            FrameAction.CCW: lambda: self._try_rotate(clockwise=False),
+            FrameAction.SOFT: lambda: self._try_move(0, 1),  # DOWN (increasing y)
+            FrameAction.HOLD: self._try_hold_action,
+        }
+
+        # Legal-move memo: consecutive observation builds between locks see
+        # the same board/piece/hold state and reuse the enumeration
+        self._legal_moves_key: Optional[tuple] = None
+        self._legal_moves_cache: List[LegalMove] = []
+
     def reset(self, seed: int) -> Observation:
         """Reset the environment with a new seed.
 
@@ -177,6 +208,7 @@ class TetrisEnv:
         self.hold_piece = None
         self.hold_used_this_turn = False
         self.gravity_counter = 0
+        self._legal_moves_key = None
 
         self._spawn_piece()
         self.last_features = compute_features(self.board)
@@ -197,20 +229,11 @@ class TetrisEnv:
 
         events = []
         lines_cleared = 0
-        old_features = self.last_features.copy()
+        # No copy needed: last_features is rebound (never mutated) below
+        old_features = self.last_features
 
         # Execute action
-        if action == FrameAction.LEFT:
-            self._try_move(-1, 0)
-        elif action == FrameAction.RIGHT:
-            self._try_move(1, 0)
-        elif action == FrameAction.CW:
-            self._try_rotate(clockwise=True)
-        elif action == FrameAction.CCW:
-            self._try_rotate(clockwise=False)
-        elif action == FrameAction.SOFT:
-            self._try_move(0, 1)  # Soft drop moves DOWN (increasing y)
-        elif action == FrameAction.HARD:
+        if action == FrameAction.HARD:
             lines_from_drop, spawned = self._hard_drop()
             events.append("hard_drop")
             if lines_from_drop > 0:
@@ -218,10 +241,10 @@ class TetrisEnv:
                 events.append("clear")
             if spawned:
                 events.append("spawn")
-        elif action == FrameAction.HOLD:
-            if self.hold_enabled:
-                self._try_hold()
-        # NOOP does nothing
+        else:
+            handler = self._action_handlers.get(action)
+            if handler is not None:  # NOOP does nothing
+                handler()
 
         # Apply gravity (only if not hard dropped)
         if action != FrameAction.HARD:
@@ -262,7 +285,7 @@ class TetrisEnv:
                     if lines_cleared > 0:
                         events.append("clear")
                         self.lines_total += lines_cleared
-                        self.score += calculate_score(lines_cleared)
+                        self.score += _SCORE_TABLE[lines_cleared]
 
                     # Spawn next piece
                     self._spawn_piece()
@@ -310,7 +333,8 @@ class TetrisEnv:
             return StepResult(self._build_observation(), 0.0, True, {"error": "Game over"})
 
         # Save original state in case we need to restore on failure
-        original_piece = self._require_current_piece().copy()
+        # (pieces are immutable, so holding the reference is enough)
+        original_piece = self._require_current_piece()
         original_hold = self.hold_piece
         original_hold_used = self.hold_used_this_turn
 
@@ -343,7 +367,8 @@ class TetrisEnv:
 
         events = []
         lines_cleared = 0
-        old_features = self.last_features.copy()
+        # No copy needed: last_features is rebound (never mutated) below
+        old_features = self.last_features
 
         # Execute hold if needed
         if action.use_hold:
@@ -366,11 +391,10 @@ class TetrisEnv:
 
         # Calculate shortest rotation path
         rot_diff = (target_rot - current_rot) % 4
-        print(f"[step_placement] Rotating: current_rot={current_rot}, target_rot={target_rot}, rot_diff={rot_diff}", flush=True)
         for i in range(rot_diff):
             if not self._try_rotate(clockwise=True):
                 # Rotation failed - restore state
-                print(f"[step_placement] Rotation FAILED at step {i}", flush=True)
+                logger.debug("step_placement: rotation failed at step %d", i)
                 self.current_piece = original_piece
                 self.hold_piece = original_hold
                 self.hold_used_this_turn = original_hold_used
@@ -386,19 +410,17 @@ class TetrisEnv:
         current_x = self._require_current_piece().x
         dx = target_x - current_x
 
-        print(f"[step_placement] Moving horizontally: current_x={current_x}, target_x={target_x}, dx={dx}", flush=True)
         if dx != 0:
             direction = 1 if dx > 0 else -1
             for i in range(abs(dx)):
-                print(f"[step_placement] Move step {i+1}/{abs(dx)}: piece.x={self._require_current_piece().x}, direction={direction}", flush=True)
                 if not self._try_move(direction, 0):
                     # Movement failed - restore state
-                    print(f"[step_placement] Movement FAILED at step {i}: current_x={self._require_current_piece().x}, target_x={target_x}", flush=True)
-                    print(f"[step_placement] RESTORING: original piece was at x={original_piece.x}, rot={original_piece.rot}", flush=True)
+                    logger.debug(
+                        "step_placement: movement failed at step %d (target_x=%d)", i, target_x
+                    )
                     self.current_piece = original_piece
                     self.hold_piece = original_hold
                     self.hold_used_this_turn = original_hold_used
-                    print(f"[step_placement] RESTORED: current piece now at x={self._require_current_piece().x}, rot={self._require_current_piece().rot}", flush=True)
                     return StepResult(
                         self._build_observation(),
                         -100.0,
@@ -504,20 +526,19 @@ class TetrisEnv:
         if not self.current_piece:
             return (0, False)
 
-        # Drop down until collision (y=0 is top, y=19 is bottom)
-        while True:
-            active_piece = self._require_current_piece()
-            moved_piece = active_piece.move(0, 1)
-            if self.board.collides(moved_piece):
-                break
-            self.current_piece = moved_piece
+        # Drop down until collision (y=0 is top, y=19 is bottom); the board
+        # computes the resting row in one mask scan
+        active_piece = self._require_current_piece()
+        rest_y = self.board.drop_y(active_piece)
+        if rest_y != active_piece.y:
+            self.current_piece = active_piece.move(0, rest_y - active_piece.y)
 
         # Immediately lock
         self.board.lock_piece(self._require_current_piece())
         lines_cleared = self.board.clear_lines()
         if lines_cleared > 0:
             self.lines_total += lines_cleared
-            self.score += calculate_score(lines_cleared)
+            self.score += _SCORE_TABLE[lines_cleared]
 
         self._spawn_piece()
         self.hold_used_this_turn = False
@@ -527,6 +548,11 @@ class TetrisEnv:
 
         return (lines_cleared, True)
 
+    def _try_hold_action(self) -> None:
+        """HOLD frame action: hold only when the feature is enabled."""
+        if self.hold_enabled:
+            self._try_hold()
+
     def _try_hold(self) -> bool:
         """Try to hold the current piece.
 
@@ -566,8 +592,24 @@ class TetrisEnv:
         if not self.current_piece:
             return []
 
-        moves = []
         active_piece = self._require_current_piece()
+
+        # Everything the enumeration depends on; board.version tracks content
+        cache_key = (
+            self.board.version,
+            active_piece.type,
+            active_piece.x,
+            active_piece.y,
+            active_piece.rot,
+            self.hold_piece,
+            self.hold_used_this_turn,
+        )
+        if cache_key == self._legal_moves_key:
+            # Shared with past observations of this state; callers must not
+            # mutate the returned list in place
+            return self._legal_moves_cache
+
+        moves = []
         pieces_to_try = [active_piece.type]
 
         if self.hold_enabled and self.hold_piece and not self.hold_used_this_turn:
@@ -580,12 +622,10 @@ class TetrisEnv:
                 spawn_x, spawn_y = get_spawn_position(piece_type)
                 start_piece = Piece(piece_type, spawn_x, spawn_y, rot=0)
             else:
-                start_piece = active_piece.copy()
+                start_piece = active_piece
 
             for target_rot in range(4):
-                shape = PIECE_SHAPES[piece_type][target_rot]
-                min_dx = min(dx for dx, _ in shape)
-                max_dx = max(dx for dx, _ in shape)
+                min_dx, _, max_dx, _ = PIECE_BOUNDS[(piece_type, target_rot)]
 
                 min_x = -min_dx
                 max_x = self.board.WIDTH - 1 - max_dx
@@ -636,27 +676,25 @@ class TetrisEnv:
                         if not movement_succeeded:
                             continue
 
-                    # Drop until collision
-                    drop_piece = test_piece
-                    while True:
-                        moved_down = drop_piece.move(0, 1)
-                        if self.board.collides(moved_down):
-                            break
-                        drop_piece = moved_down
+                    # Drop until collision (single mask scan)
+                    final_y = self.board.drop_y(test_piece)
 
                     moves.append(
-                        LegalMove(drop_piece.x, drop_piece.rot, use_hold, drop_piece.y)
+                        LegalMove(test_piece.x, test_piece.rot, use_hold, final_y)
                     )
 
-        # Remove duplicates
+        # Remove duplicates; the key fields pack into one small int
+        # (x >= -2, rot < 4, harddrop_y < 32), skipping tuple allocation
         unique_moves = []
         seen = set()
         for move in moves:
-            key = (move.x, move.rot, move.use_hold, move.harddrop_y)
+            key = (move.x + 2) | (move.rot << 4) | (move.use_hold << 6) | (move.harddrop_y << 7)
             if key not in seen:
                 seen.add(key)
                 unique_moves.append(move)
 
+        self._legal_moves_key = cache_key
+        self._legal_moves_cache = unique_moves
         return unique_moves
 
     def _build_observation(self) -> Observation:
@@ -669,16 +707,19 @@ class TetrisEnv:
             schema_version=self.SCHEMA_VERSION,
             tick=self.tick,
             board=self.board.copy(),
-            current=self.current_piece.copy() if self.current_piece else Piece("I", 0, 0),
+            # Pieces are immutable; the observation can share the instance
+            current=self.current_piece if self.current_piece else Piece("I", 0, 0),
             next_queue=self.rng.peek(self.next_queue_size) if self.rng else [],
             hold_type=self.hold_piece,
             hold_used=self.hold_used_this_turn,
-            features=compute_features(self.board),
+            # Maintained by reset/step after every board mutation; rebuilding
+            # here would recompute the same values a second time per tick
+            features=self.last_features,
             score=self.score,
             lines_total=self.lines_total,
             top_out=self.done,
             seed=self.seed,
-            legal_moves=self.compute_legal_moves(),
+            legal_moves=self.compute_legal_moves() if self.legal_moves_enabled else [],
             srs_enabled=self.srs_enabled,
             hold_enabled=self.hold_enabled,
         )
@@ -3,7 +3,9 @@
 These features are commonly used in heuristic-based and RL agents.
 """
 
+import operator
 from typing import Dict
+
 from tetris_core.board import Board
 
 
@@ -49,7 +51,8 @@ def bumpiness(heights: list[int]) -> int:
     Returns:
         Total bumpiness
     """
-    return sum(abs(heights[i] - heights[i + 1]) for i in range(len(heights) - 1))
+    # map/operator keep the pairwise differences at C level; no index frames
+    return sum(map(abs, map(operator.sub, heights, heights[1:])))
 
 
 def max_well_depth(heights: list[int]) -> int:
@@ -98,6 +101,9 @@ def total_holes(board: Board) -> int:
 def row_transitions(board: Board) -> int:
     """Count transitions from filled to empty (or vice versa) in rows.
 
+    Works on the row occupancy masks: each row is extended with filled
+    border bits and the transitions fall out of one XOR + popcount.
+
     Args:
         board: Current board
 
@@ -105,19 +111,12 @@ def row_transitions(board: Board) -> int:
         Total row transitions
     """
     transitions = 0
+    boundary = (1 << (board.WIDTH + 1)) - 1  # Transition positions to count
 
-    for y in range(board.HEIGHT):
-        for x in range(board.WIDTH - 1):
-            current = board.get(x, y)
-            next_cell = board.get(x + 1, y)
-            if (current == 0) != (next_cell == 0):
-                transitions += 1
-
-        # Count edge transitions (board edges are considered filled)
-        if board.get(0, y) == 0:
-            transitions += 1
-        if board.get(board.WIDTH - 1, y) == 0:
-            transitions += 1
+    for mask in board.get_row_masks():
+        # Filled border bits on both sides (board edges count as filled)
+        extended = (1 << (board.WIDTH + 1)) | (mask << 1) | 1
+        transitions += ((extended ^ (extended >> 1)) & boundary).bit_count()
 
     return transitions
 
@@ -125,28 +124,23 @@ def row_transitions(board: Board) -> int:
 def column_transitions(board: Board) -> int:
     """Count transitions from filled to empty (or vice versa) in columns.
 
+    Works on the row occupancy masks: XOR of adjacent rows marks every
+    vertical transition across all 10 columns at once.
+
     Args:
         board: Current board
 
     Returns:
         Total column transitions
     """
-    transitions = 0
-
-    for x in range(board.WIDTH):
-        for y in range(board.HEIGHT - 1):
-            current = board.get(x, y)
-            next_cell = board.get(x, y + 1)
-            if (current == 0) != (next_cell == 0):
-                transitions += 1
+    masks = board.get_row_masks()
 
-        # Count top edge transition (top is considered empty)
-        if board.get(x, 0) != 0:
-            transitions += 1
+    # Top edge is considered empty, bottom edge filled
+    transitions = masks[0].bit_count()
+    transitions += (~masks[board.HEIGHT - 1] & board.FULL_ROW).bit_count()
 
-        # Count bottom edge transition (bottom is considered filled)
-        if board.get(x, board.HEIGHT - 1) == 0:
-            transitions += 1
+    for y in range(board.HEIGHT - 1):
+        transitions += (masks[y] ^ masks[y + 1]).bit_count()
 
     return transitions
 
@@ -7,59 +7,108 @@ Coordinates are relative to the piece's origin (top-left of bounding box).
 from typing import List, Tuple
 
 # Type alias for piece coordinates
-Coords = List[Tuple[int, int]]
+Coords = Tuple[Tuple[int, int], ...]
 
 # Piece shapes in 4 rotation states (0=spawn, 1=R, 2=2, 3=L)
-# Format: {piece_type: [rotation_0, rotation_1, rotation_2, rotation_3]}
-# Each rotation is a list of (x, y) offsets relative to piece origin
-PIECE_SHAPES: dict[str, List[Coords]] = {
-    "I": [
-        [(0, 1), (1, 1), (2, 1), (3, 1)],  # 0: horizontal
-        [(2, 0), (2, 1), (2, 2), (2, 3)],  # R: vertical
-        [(0, 2), (1, 2), (2, 2), (3, 2)],  # 2: horizontal (shifted)
-        [(1, 0), (1, 1), (1, 2), (1, 3)],  # L: vertical (shifted)
-    ],
-    "O": [
-        [(1, 0), (2, 0), (1, 1), (2, 1)],  # All rotations identical
-        [(1, 0), (2, 0), (1, 1), (2, 1)],
-        [(1, 0), (2, 0), (1, 1), (2, 1)],
-        [(1, 0), (2, 0), (1, 1), (2, 1)],
-    ],
-    "T": [
-        [(1, 0), (0, 1), (1, 1), (2, 1)],  # 0: T-up
-        [(1, 0), (1, 1), (2, 1), (1, 2)],  # R: T-right
-        [(0, 1), (1, 1), (2, 1), (1, 2)],  # 2: T-down
-        [(1, 0), (0, 1), (1, 1), (1, 2)],  # L: T-left
-    ],
-    "S": [
-        [(1, 0), (2, 0), (0, 1), (1, 1)],  # 0: horizontal
-        [(1, 0), (1, 1), (2, 1), (2, 2)],  # R: vertical
-        [(1, 1), (2, 1), (0, 2), (1, 2)],  # 2: horizontal (shifted)
-        [(0, 0), (0, 1), (1, 1), (1, 2)],  # L: vertical (shifted)
-    ],
-    "Z": [
-        [(0, 0), (1, 0), (1, 1), (2, 1)],  # 0: horizontal
-        [(2, 0), (1, 1), (2, 1), (1, 2)],  # R: vertical
-        [(0, 1), (1, 1), (1, 2), (2, 2)],  # 2: horizontal (shifted)
-        [(1, 0), (0, 1), (1, 1), (0, 2)],  # L: vertical (shifted)
-    ],
-    "J": [
-        [(0, 0), (0, 1), (1, 1), (2, 1)],  # 0: J-up
-        [(1, 0), (2, 0), (1, 1), (1, 2)],  # R: J-right
-        [(0, 1), (1, 1), (2, 1), (2, 2)],  # 2: J-down
-        [(1, 0), (1, 1), (0, 2), (1, 2)],  # L: J-left
-    ],
-    "L": [
-        [(2, 0), (0, 1), (1, 1), (2, 1)],  # 0: L-up
-        [(1, 0), (1, 1), (1, 2), (2, 2)],  # R: L-right
-        [(0, 1), (1, 1), (2, 1), (0, 2)],  # 2: L-down
-        [(0, 0), (1, 0), (1, 1), (1, 2)],  # L: L-left
-    ],
+# Format: {piece_type: (rotation_0, rotation_1, rotation_2, rotation_3)}
+# Each rotation is a tuple of (x, y) offsets relative to piece origin;
+# nested tuples are immutable, compact, and fork-shareable for the
+# multiprocessing benchmark workers
+PIECE_SHAPES: dict[str, tuple] = {
+    "I": (
+        ((0, 1), (1, 1), (2, 1), (3, 1)),  # 0: horizontal
+        ((2, 0), (2, 1), (2, 2), (2, 3)),  # R: vertical
+        ((0, 2), (1, 2), (2, 2), (3, 2)),  # 2: horizontal (shifted)
+        ((1, 0), (1, 1), (1, 2), (1, 3)),  # L: vertical (shifted)
+    ),
+    "O": (
+        ((1, 0), (2, 0), (1, 1), (2, 1)),  # All rotations identical
+        ((1, 0), (2, 0), (1, 1), (2, 1)),
+        ((1, 0), (2, 0), (1, 1), (2, 1)),
+        ((1, 0), (2, 0), (1, 1), (2, 1)),
+    ),
+    "T": (
+        ((1, 0), (0, 1), (1, 1), (2, 1)),  # 0: T-up
+        ((1, 0), (1, 1), (2, 1), (1, 2)),  # R: T-right
+        ((0, 1), (1, 1), (2, 1), (1, 2)),  # 2: T-down
+        ((1, 0), (0, 1), (1, 1), (1, 2)),  # L: T-left
+    ),
+    "S": (
+        ((1, 0), (2, 0), (0, 1), (1, 1)),  # 0: horizontal
+        ((1, 0), (1, 1), (2, 1), (2, 2)),  # R: vertical
+        ((1, 1), (2, 1), (0, 2), (1, 2)),  # 2: horizontal (shifted)
+        ((0, 0), (0, 1), (1, 1), (1, 2)),  # L: vertical (shifted)
+    ),
+    "Z": (
+        ((0, 0), (1, 0), (1, 1), (2, 1)),  # 0: horizontal
+        ((2, 0), (1, 1), (2, 1), (1, 2)),  # R: vertical
+        ((0, 1), (1, 1), (1, 2), (2, 2)),  # 2: horizontal (shifted)
+        ((1, 0), (0, 1), (1, 1), (0, 2)),  # L: vertical (shifted)
+    ),
+    "J": (
+        ((0, 0), (0, 1), (1, 1), (2, 1)),  # 0: J-up
+        ((1, 0), (2, 0), (1, 1), (1, 2)),  # R: J-right
+        ((0, 1), (1, 1), (2, 1), (2, 2)),  # 2: J-down
+        ((1, 0), (1, 1), (0, 2), (1, 2)),  # L: J-left
+    ),
+    "L": (
+        ((2, 0), (0, 1), (1, 1), (2, 1)),  # 0: L-up
+        ((1, 0), (1, 1), (1, 2), (2, 2)),  # R: L-right
+        ((0, 1), (1, 1), (2, 1), (0, 2)),  # 2: L-down
+        ((0, 0), (1, 0), (1, 1), (1, 2)),  # L: L-left
+    ),
 }
 
 
+# Flattened (type, rotation) -> tuple of (dx, dy) offsets, resolved once at
+# import time so get_cells skips the nested PIECE_SHAPES indexing.
+PIECE_CELL_OFFSETS: dict[tuple[str, int], tuple] = {
+    (_type, _rot): tuple(_shape)
+    for _type, _rotations in PIECE_SHAPES.items()
+    for _rot, _shape in enumerate(_rotations)
+}
+
+# Mean relative cell row per (type, rotation); lets landing height be
+# computed as (HEIGHT - piece_y - mean_dy) without touching the cells.
+PIECE_MEAN_DY: dict[tuple[str, int], float] = {
+    key: sum(_dy for _, _dy in offsets) / len(offsets)
+    for key, offsets in PIECE_CELL_OFFSETS.items()
+}
+
+# Per-(type, rotation) occupancy row masks and bounding boxes, derived from
+# PIECE_SHAPES at import time. A mask holds the piece's bits for one relative
+# row at x=0; shifting by the piece's x yields board-row bits, so a collision
+# test is one AND per occupied row instead of four per-cell probes.
+PIECE_ROW_MASKS: dict[tuple[str, int], tuple] = {}
+PIECE_BOUNDS: dict[tuple[str, int], tuple] = {}
+# Lowest occupied cell row per piece column: (dx, max dy in that column);
+# lets a drop land on the surface tops in one step per column
+PIECE_COL_BOTTOMS: dict[tuple[str, int], tuple] = {}
+
+for _type, _rotations in PIECE_SHAPES.items():
+    for _rot, _shape in enumerate(_rotations):
+        _masks: dict[int, int] = {}
+        _bottoms: dict[int, int] = {}
+        for _dx, _dy in _shape:
+            _masks[_dy] = _masks.get(_dy, 0) | (1 << _dx)
+            _bottoms[_dx] = max(_bottoms.get(_dx, -1), _dy)
+        PIECE_ROW_MASKS[(_type, _rot)] = tuple(sorted(_masks.items()))
+        PIECE_COL_BOTTOMS[(_type, _rot)] = tuple(sorted(_bottoms.items()))
+        _xs = [_dx for _dx, _ in _shape]
+        _ys = [_dy for _, _dy in _shape]
+        PIECE_BOUNDS[(_type, _rot)] = (min(_xs), min(_ys), max(_xs), max(_ys))
+
+
 class Piece:
-    """Represents a tetromino piece at a specific position and rotation."""
+    """Represents a tetromino piece at a specific position and rotation.
+
+    Pieces are immutable, so move/rotate/copy return interned instances from
+    a module-level pool keyed by (type, x, y, rot); the enumeration loops
+    revisit the same few thousand poses constantly, and interning removes the
+    per-step allocations (and shares each pose's lazy cell cache).
+    """
+
+    __slots__ = ("type", "x", "y", "rot", "_cells")
 
     def __init__(self, piece_type: str, x: int = 0, y: int = 0, rot: int = 0):
         """Initialize a piece.
@@ -76,6 +125,7 @@ class Piece:
         self.x = x
         self.y = y
         self.rot = rot % 4
+        self._cells: List[Tuple[int, int]] = None  # Lazy absolute-cell cache
 
     def get_cells(self) -> List[Tuple[int, int]]:
         """Get absolute board coordinates of all 4 cells.
@@ -83,8 +133,12 @@ class Piece:
         Returns:
             List of (x, y) tuples in board coordinates
         """
-        offsets = PIECE_SHAPES[self.type][self.rot]
-        return [(self.x + dx, self.y + dy) for dx, dy in offsets]
+        cells = self._cells
+        if cells is None:
+            x, y = self.x, self.y
+            cells = [(x + dx, y + dy) for dx, dy in PIECE_CELL_OFFSETS[(self.type, self.rot)]]
+            self._cells = cells
+        return cells
 
     def get_bounding_box(self) -> Tuple[int, int, int, int]:
         """Get bounding box of the piece.
@@ -92,43 +146,63 @@ class Piece:
         Returns:
             (min_x, min_y, max_x, max_y) relative to piece origin
         """
-        offsets = PIECE_SHAPES[self.type][self.rot]
-        xs = [dx for dx, _ in offsets]
-        ys = [dy for _, dy in offsets]
-        return (min(xs), min(ys), max(xs), max(ys))
+        return PIECE_BOUNDS[(self.type, self.rot)]
 
     def copy(self) -> "Piece":
         """Create a copy of this piece."""
-        return Piece(self.type, self.x, self.y, self.rot)
+        return _intern(self.type, self.x, self.y, self.rot)
 
     def move(self, dx: int, dy: int) -> "Piece":
-        """Return a new piece moved by the given delta.
+        """Return a piece moved by the given delta.
 
         Args:
             dx: Change in x
             dy: Change in y
 
         Returns:
-            New piece at the moved position
+            Piece at the moved position (interned)
         """
-        return Piece(self.type, self.x + dx, self.y + dy, self.rot)
+        return _intern(self.type, self.x + dx, self.y + dy, self.rot)
 
     def rotate(self, clockwise: bool = True) -> "Piece":
-        """Return a new piece rotated.
+        """Return a piece rotated.
 
         Args:
             clockwise: True for clockwise, False for counter-clockwise
 
         Returns:
-            New piece with updated rotation
+            Piece with updated rotation (interned)
         """
         new_rot = (self.rot + (1 if clockwise else -1)) % 4
-        return Piece(self.type, self.x, self.y, new_rot)
+        return _intern(self.type, self.x, self.y, new_rot)
 
     def __repr__(self) -> str:
         return f"Piece({self.type}, x={self.x}, y={self.y}, rot={self.rot})"
 
 
+# Piece pose pool backing the interning above. Poses reachable in play are
+# bounded (coordinates only a few cells beyond the board), so the pool stays
+# small and never needs eviction.
+_PIECE_CACHE: dict = {}
+
+
+def _intern(piece_type: str, x: int, y: int, rot: int) -> Piece:
+    """Return the pooled piece for a pose, creating it on first use."""
+    key = (piece_type, x, y, rot)
+    piece = _PIECE_CACHE.get(key)
+    if piece is None:
+        piece = Piece(piece_type, x, y, rot)
+        _PIECE_CACHE[key] = piece
+    return piece
+
+
+# Standard spawn positions: horizontally centered at y=1 (near top, room
+# for the piece above the skyline); O sits one column right of the rest
+_SPAWN_POSITIONS = {
+    piece_type: (4, 1) if piece_type == "O" else (3, 1) for piece_type in PIECE_SHAPES
+}
+
+
 def get_spawn_position(piece_type: str) -> Tuple[int, int]:
     """Get the standard spawn position for a piece type.
 
@@ -141,11 +215,4 @@ def get_spawn_position(piece_type: str) -> Tuple[int, int]:
     Returns:
         (x, y) spawn coordinates
     """
-    # Standard spawn: horizontally centered, at top of board
-    # Spawn at y=1 (near top, room for piece above skyline)
-    if piece_type == "I":
-        return (3, 1)  # I-piece
-    elif piece_type == "O":
-        return (4, 1)  # O-piece centered
-    else:
-        return (3, 1)  # T, S, Z, J, L
+    return _SPAWN_POSITIONS[piece_type]
@@ -21,13 +21,23 @@ class SevenBagRNG:
         """
         self.seed = seed
         self.rng = random.Random(seed)
-        self.bag: List[str] = []
-        self._refill_bag()
-
-    def _refill_bag(self) -> None:
-        """Shuffle all 7 pieces into the bag."""
-        self.bag = self.PIECES.copy()
-        self.rng.shuffle(self.bag)
+        # Upcoming pieces in deal order; bags are generated ahead on demand,
+        # so peek() is a slice instead of an RNG state copy per call
+        self._queue: List[str] = []
+        self._queue_pos = 0
+
+    def _refill_queue(self) -> None:
+        """Shuffle a fresh bag and append it to the upcoming queue."""
+        # Drop already-dealt pieces occasionally so the queue stays small
+        if self._queue_pos > 64:
+            del self._queue[: self._queue_pos]
+            self._queue_pos = 0
+
+        bag = self.PIECES.copy()
+        self.rng.shuffle(bag)
+        # Historical deal order popped from the bag's end; preserved so
+        # seeded sequences stay identical across versions
+        self._queue.extend(reversed(bag))
 
     def next(self) -> str:
         """Get the next piece from the bag.
@@ -35,9 +45,11 @@ class SevenBagRNG:
         Returns:
             Piece type string ("I", "O", "T", "S", "Z", "J", "L")
         """
-        if not self.bag:
-            self._refill_bag()
-        return self.bag.pop()
+        if self._queue_pos >= len(self._queue):
+            self._refill_queue()
+        piece = self._queue[self._queue_pos]
+        self._queue_pos += 1
+        return piece
 
     def peek(self, count: int) -> List[str]:
         """Peek at the next N pieces without consuming them.
@@ -48,18 +60,9 @@ class SevenBagRNG:
         Returns:
             List of piece types
         """
-        result = []
-        temp_bag = self.bag.copy()
-        temp_rng = random.Random()
-        temp_rng.setstate(self.rng.getstate())
-
-        for _ in range(count):
-            if not temp_bag:
-                temp_bag = self.PIECES.copy()
-                temp_rng.shuffle(temp_bag)
-            result.append(temp_bag.pop())
-
-        return result
+        while len(self._queue) - self._queue_pos < count:
+            self._refill_queue()
+        return self._queue[self._queue_pos:self._queue_pos + count]
 
     def reset(self, seed: int) -> None:
         """Reset the RNG with a new seed.
@@ -69,5 +72,5 @@ class SevenBagRNG:
         """
         self.seed = seed
         self.rng = random.Random(seed)
-        self.bag = []
-        self._refill_bag()
+        self._queue = []
+        self._queue_pos = 0
@@ -14,31 +14,39 @@ from tetris_core.board import Board
 
 # Wall kick data for J, L, S, T, Z pieces
 WALL_KICKS_JLSTZ = {
-    (0, 1): [(0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)],  # 0->R
-    (1, 0): [(0, 0), (1, 0), (1, -1), (0, 2), (1, 2)],      # R->0
-    (1, 2): [(0, 0), (1, 0), (1, -1), (0, 2), (1, 2)],      # R->2
-    (2, 1): [(0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)],  # 2->R
-    (2, 3): [(0, 0), (1, 0), (1, 1), (0, -2), (1, -2)],     # 2->L
-    (3, 2): [(0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)],   # L->2
-    (3, 0): [(0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)],   # L->0
-    (0, 3): [(0, 0), (1, 0), (1, 1), (0, -2), (1, -2)],     # 0->L
+    (0, 1): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),  # 0->R
+    (1, 0): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),      # R->0
+    (1, 2): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),      # R->2
+    (2, 1): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),  # 2->R
+    (2, 3): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),     # 2->L
+    (3, 2): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),   # L->2
+    (3, 0): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),   # L->0
+    (0, 3): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),     # 0->L
 }
 
 # Wall kick data for I piece (different from JLSTZ)
 WALL_KICKS_I = {
-    (0, 1): [(0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)],   # 0->R
-    (1, 0): [(0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)],   # R->0
-    (1, 2): [(0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)],   # R->2
-    (2, 1): [(0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)],   # 2->R
-    (2, 3): [(0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)],   # 2->L
-    (3, 2): [(0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)],   # L->2
-    (3, 0): [(0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)],   # L->0
-    (0, 3): [(0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)],   # 0->L
+    (0, 1): ((0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)),   # 0->R
+    (1, 0): ((0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)),   # R->0
+    (1, 2): ((0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)),   # R->2
+    (2, 1): ((0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)),   # 2->R
+    (2, 3): ((0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)),   # 2->L
+    (3, 2): ((0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)),   # L->2
+    (3, 0): ((0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)),   # L->0
+    (0, 3): ((0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)),   # 0->L
 }
 
 # O piece doesn't kick (rotations are identical)
 WALL_KICKS_O = {}
 
+# Several transitions share identical offset rows (e.g. 0->R and 2->R);
+# point equal keys at one shared tuple instead of duplicate objects
+_interned_rows: dict = {}
+for _table in (WALL_KICKS_JLSTZ, WALL_KICKS_I):
+    for _key, _row in _table.items():
+        _table[_key] = _interned_rows.setdefault(_row, _row)
+del _interned_rows
+
 
 class SRSRules:
     """Super Rotation System rules implementation."""
@@ -64,6 +72,12 @@ class SRSRules:
         Returns:
             Rotated piece if successful, None if rotation impossible
         """
+        # O rotations are identity shapes and never kick: the rotated pose
+        # occupies exactly the current (legal) cells, so skip the collision
+        # test while keeping the rot bookkeeping
+        if piece.type == "O":
+            return piece.rotate(clockwise)
+
         # Basic rotation
         rotated = piece.rotate(clockwise)
 
@@ -75,18 +89,15 @@ class SRSRules:
         if not self.enabled:
             return None
 
-        # Try wall kicks
-        kick_table = self._get_kick_table(piece.type)
-        from_rot = piece.rot
-        to_rot = rotated.rot
-        key = (from_rot, to_rot)
-
-        if key not in kick_table:
+        # Try wall kicks; one probe resolves the transition's offsets
+        kicks = self._get_kick_table(piece.type).get((piece.rot, rotated.rot))
+        if kicks is None:
             return None
 
-        # Try each kick offset
-        for dx, dy in kick_table[key]:
-            test_piece = Piece(rotated.type, rotated.x + dx, rotated.y + dy, rotated.rot)
+        # Try each kick offset; move() hands back interned poses, so the
+        # kick sweep allocates nothing
+        for dx, dy in kicks:
+            test_piece = rotated.move(dx, dy)
             if not board.collides(test_piece):
                 return test_piece
 
@@ -112,6 +123,8 @@ class SRSRules:
 class LockDelay:
     """Lock delay timer for piece placement."""
 
+    __slots__ = ("delay_ticks", "ticks_on_ground", "active")
+
     def __init__(self, delay_ticks: int = 30):
         """Initialize lock delay.
 
@@ -158,6 +171,10 @@ class LockDelay:
         return board.collides(moved_down)
 
 
+# Original Nintendo scoring: single, double, triple, Tetris
+_SCORE_TABLE = (0, 40, 100, 300, 1200)
+
+
 def calculate_score(lines_cleared: int, level: int = 1) -> int:
     """Calculate score from lines cleared (original Nintendo scoring).
 
@@ -168,11 +185,6 @@ def calculate_score(lines_cleared: int, level: int = 1) -> int:
     Returns:
         Score points
     """
-    score_table = {
-        0: 0,
-        1: 40,    # Single
-        2: 100,   # Double
-        3: 300,   # Triple
-        4: 1200,  # Tetris
-    }
-    return score_table.get(lines_cleared, 0) * level
+    if 0 <= lines_cleared <= 4:
+        return _SCORE_TABLE[lines_cleared] * level
+    return 0
@@ -1,14 +1,16 @@
 """Runner framework for executing and evaluating agents."""
 
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
-import time
 
 from tetris_core.agent import Agent
 from tetris_core.env import TetrisEnv, PlacementAction
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeStats:
     """Statistics for a single episode."""
 
@@ -18,7 +20,7 @@ class EpisodeStats:
     pieces_placed: int
     ticks: int
     duration_seconds: float
-    final_board_state: List[int]  # Flat array of board cells
+    final_board_state: Optional[List[int]]  # Flat board cells (None unless captured)
     max_height: int
     total_holes: int
     top_out: bool
@@ -47,30 +49,71 @@ class BenchmarkResults:
     episodes: List[EpisodeStats] = field(default_factory=list)
 
     def get_summary(self) -> dict:
-        """Get summary statistics across all episodes."""
+        """Get summary statistics across all episodes.
+
+        Single pass over the episode list; each episode's fields are read
+        once instead of once per aggregate.
+        """
         if not self.episodes:
             return {}
 
+        total_score = total_lines = total_pieces = 0
+        total_duration = 0.0
+        max_score = max_lines = max_pieces = 0
+        min_score = min_lines = min_pieces = None
+
+        for episode in self.episodes:
+            score = episode.score
+            lines = episode.lines_cleared
+            pieces = episode.pieces_placed
+
+            total_score += score
+            total_lines += lines
+            total_pieces += pieces
+            total_duration += episode.duration_seconds
+
+            if score > max_score:
+                max_score = score
+            if lines > max_lines:
+                max_lines = lines
+            if pieces > max_pieces:
+                max_pieces = pieces
+            if min_score is None or score < min_score:
+                min_score = score
+            if min_lines is None or lines < min_lines:
+                min_lines = lines
+            if min_pieces is None or pieces < min_pieces:
+                min_pieces = pieces
+
+        count = len(self.episodes)
         return {
             "agent_name": self.agent_name,
             "num_episodes": self.num_episodes,
-            "avg_score": sum(e.score for e in self.episodes) / len(self.episodes),
-            "avg_lines": sum(e.lines_cleared for e in self.episodes)
-            / len(self.episodes),
-            "avg_pieces": sum(e.pieces_placed for e in self.episodes)
-            / len(self.episodes),
-            "max_score": max(e.score for e in self.episodes),
-            "max_lines": max(e.lines_cleared for e in self.episodes),
-            "max_pieces": max(e.pieces_placed for e in self.episodes),
-            "min_score": min(e.score for e in self.episodes),
-            "min_lines": min(e.lines_cleared for e in self.episodes),
-            "min_pieces": min(e.pieces_placed for e in self.episodes),
-            "avg_duration": sum(e.duration_seconds for e in self.episodes)
-            / len(self.episodes),
-            "total_duration": sum(e.duration_seconds for e in self.episodes),
+            "avg_score": total_score / count,
+            "avg_lines": total_lines / count,
+            "avg_pieces": total_pieces / count,
+            "max_score": max_score,
+            "max_lines": max_lines,
+            "max_pieces": max_pieces,
+            "min_score": min_score,
+            "min_lines": min_lines,
+            "min_pieces": min_pieces,
+            "avg_duration": total_duration / count,
+            "total_duration": total_duration,
         }
 
 
+def _run_episode_worker(args: tuple) -> "EpisodeStats":
+    """Run a single episode in a worker process.
+
+    Module-level so it pickles cleanly; receives everything it needs as a
+    tuple of (agent, seed, max_pieces, runner kwargs).
+    """
+    agent, seed, max_pieces, runner_kwargs = args
+    runner = Runner(verbose=False, **runner_kwargs)
+    return runner.run_episode(agent, seed, max_pieces)
+
+
 class Runner:
     """Framework for running agents and collecting statistics."""
 
@@ -80,6 +123,8 @@ class Runner:
         hold_enabled: bool = True,
         lock_delay_ticks: int = 30,
         verbose: bool = True,
+        capture_board: bool = False,
+        output_path: Optional[str] = None,
     ):
         """Initialize runner.
 
@@ -88,11 +133,19 @@ class Runner:
             hold_enabled: Enable hold functionality
             lock_delay_ticks: Lock delay in ticks
             verbose: Print progress messages
+            capture_board: Store each episode's final board cells on its
+                stats (off by default; nothing in the summary reads them
+                and they dominate memory in long sweeps)
+            output_path: Append each episode's stats to this JSONL file as
+                it is produced (long sweeps can be analyzed offline without
+                holding everything in memory)
         """
         self.srs_enabled = srs_enabled
         self.hold_enabled = hold_enabled
         self.lock_delay_ticks = lock_delay_ticks
         self.verbose = verbose
+        self.capture_board = capture_board
+        self.output_path = output_path
 
     def run_episode(
         self, agent: Agent, seed: int, max_pieces: Optional[int] = None
@@ -116,8 +169,16 @@ class Runner:
         obs = env.reset(seed)
         agent.on_episode_start(seed)
 
+        # Resolve the per-step hook once; the base implementation is a no-op,
+        # so agents that don't override it skip the call entirely
+        step_hook = (
+            agent.on_step_result
+            if type(agent).on_step_result is not Agent.on_step_result
+            else None
+        )
+
         pieces_placed = 0
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         while not obs.top_out:
             # Agent selects action
@@ -127,7 +188,8 @@ class Runner:
             result = env.step_placement(action)
 
             # Notify agent of result
-            agent.on_step_result(result)
+            if step_hook is not None:
+                step_hook(result)
 
             obs = result.obs
             pieces_placed += 1
@@ -136,7 +198,7 @@ class Runner:
             if max_pieces is not None and pieces_placed >= max_pieces:
                 break
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Compute final stats
         max_height = max(obs.board.get_column_heights())
@@ -149,7 +211,7 @@ class Runner:
             pieces_placed=pieces_placed,
             ticks=obs.tick,
             duration_seconds=duration,
-            final_board_state=obs.board.to_list(),
+            final_board_state=obs.board.to_list() if self.capture_board else None,
             max_height=max_height,
             total_holes=total_holes,
             top_out=obs.top_out,
@@ -173,14 +235,22 @@ class Runner:
         num_episodes: int,
         seeds: Optional[List[int]] = None,
         max_pieces: Optional[int] = None,
+        n_workers: Optional[int] = None,
     ) -> BenchmarkResults:
         """Run a benchmark with multiple episodes.
 
+        Episodes are independent, so with n_workers > 1 they are distributed
+        across worker processes. Agent hooks then run on the pickled worker
+        copies; the parent agent's episode statistics are replayed from the
+        returned stats so get_stats() matches a sequential run (per-step
+        callbacks are not replayed).
+
         Args:
             agent: Agent to benchmark
             num_episodes: Number of episodes to run
             seeds: List of seeds (if None, use 0, 1, 2, ...)
             max_pieces: Maximum pieces per episode (None = no limit)
+            n_workers: Worker process count (None or 1 = run sequentially)
 
         Returns:
             Benchmark results
@@ -200,12 +270,24 @@ class Runner:
 
         results = BenchmarkResults(agent_name=agent.name, num_episodes=num_episodes)
 
-        for i, seed in enumerate(seeds[:num_episodes]):
-            if self.verbose:
-                print(f"[{i+1}/{num_episodes}] ", end="", flush=True)
-
-            stats = self.run_episode(agent, seed, max_pieces)
-            results.episodes.append(stats)
+        stats_file = open(self.output_path, "a") if self.output_path else None
+        try:
+            if n_workers is not None and n_workers > 1 and num_episodes > 1:
+                results.episodes = self._run_episodes_parallel(
+                    agent, seeds[:num_episodes], max_pieces, n_workers, stats_file
+                )
+            else:
+                for i, seed in enumerate(seeds[:num_episodes]):
+                    if self.verbose:
+                        print(f"[{i+1}/{num_episodes}] ", end="", flush=True)
+
+                    stats = self.run_episode(agent, seed, max_pieces)
+                    results.episodes.append(stats)
+                    if stats_file is not None:
+                        stats_file.write(json.dumps(stats.to_dict()) + "\n")
+        finally:
+            if stats_file is not None:
+                stats_file.close()
 
         if self.verbose:
             summary = results.get_summary()
@@ -221,12 +303,60 @@ class Runner:
 
         return results
 
+    def _run_episodes_parallel(
+        self,
+        agent: Agent,
+        seeds: List[int],
+        max_pieces: Optional[int],
+        n_workers: int,
+        stats_file=None,
+    ) -> List[EpisodeStats]:
+        """Run episodes across worker processes in seed order.
+
+        Args:
+            agent: Agent to run (pickled into each worker)
+            seeds: One seed per episode
+            max_pieces: Maximum pieces per episode
+            n_workers: Worker process count
+            stats_file: Open JSONL stream for per-episode stats (optional)
+
+        Returns:
+            Episode statistics in seed order
+        """
+        runner_kwargs = {
+            "srs_enabled": self.srs_enabled,
+            "hold_enabled": self.hold_enabled,
+            "lock_delay_ticks": self.lock_delay_ticks,
+            "capture_board": self.capture_board,
+        }
+        tasks = [(agent, seed, max_pieces, runner_kwargs) for seed in seeds]
+
+        episodes = []
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            for stats in pool.map(_run_episode_worker, tasks):
+                # Replay episode accounting on the parent agent
+                agent.on_episode_start(stats.seed)
+                agent.on_episode_end(stats.score, stats.lines_cleared, stats.pieces_placed)
+                episodes.append(stats)
+                if stats_file is not None:
+                    stats_file.write(json.dumps(stats.to_dict()) + "\n")
+
+                if self.verbose:
+                    print(
+                        f"Episode {stats.seed}: {stats.pieces_placed} pieces, "
+                        f"{stats.lines_cleared} lines, score {stats.score} "
+                        f"({stats.duration_seconds:.2f}s)"
+                    )
+
+        return episodes
+
     def compare_agents(
         self,
         agents: List[Agent],
         num_episodes: int,
         seeds: Optional[List[int]] = None,
         max_pieces: Optional[int] = None,
+        n_workers: Optional[int] = None,
     ) -> Dict[str, BenchmarkResults]:
         """Compare multiple agents on the same seeds.
 
@@ -235,6 +365,7 @@ class Runner:
             num_episodes: Number of episodes per agent
             seeds: List of seeds (same for all agents)
             max_pieces: Maximum pieces per episode
+            n_workers: Worker process count (None or 1 = run sequentially)
 
         Returns:
             Dictionary mapping agent names to benchmark results
@@ -245,7 +376,7 @@ class Runner:
         results = {}
 
         for agent in agents:
-            benchmark = self.run_benchmark(agent, num_episodes, seeds, max_pieces)
+            benchmark = self.run_benchmark(agent, num_episodes, seeds, max_pieces, n_workers)
             results[agent.name] = benchmark
 
         # Print comparison
@@ -0,0 +1,122 @@
+"""Process-parallel environment vector for placement-action training.
+
+Mirrors the SubprocVecEnv pattern from RL libraries: each worker process
+owns one TetrisEnv and serves commands over a pipe, so N environments step
+concurrently without sharing the GIL. Observations cross the pipe as plain
+dicts (Observation.to_dict), which pickle cheaply.
+"""
+
+import multiprocessing
+from typing import Any, Dict, List, Sequence, Tuple
+
+from tetris_core.env import PlacementAction, TetrisEnv
+
+
+def _worker(conn, env_kwargs: dict) -> None:
+    """Worker loop: owns one TetrisEnv and serves pipe commands.
+
+    Args:
+        conn: Child end of the command pipe
+        env_kwargs: Constructor kwargs for the worker's TetrisEnv
+    """
+    env = TetrisEnv(**env_kwargs)
+    try:
+        while True:
+            command, payload = conn.recv()
+
+            if command == "reset":
+                obs = env.reset(payload)
+                conn.send(obs.to_dict())
+            elif command == "step_placement":
+                x, rot, use_hold = payload
+                result = env.step_placement(PlacementAction(x=x, rot=rot, use_hold=use_hold))
+                conn.send((result.obs.to_dict(), result.reward, result.done, result.info))
+            elif command == "close":
+                break
+            else:
+                conn.send(ValueError(f"Unknown command: {command}"))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class SubprocTetrisEnv:
+    """Vector of TetrisEnv instances, one per worker process.
+
+    Commands are sent to every worker first and the replies collected
+    afterwards, so the N environments compute in parallel.
+    """
+
+    def __init__(self, num_envs: int, **env_kwargs):
+        """Start the worker processes.
+
+        Args:
+            num_envs: Number of environments / worker processes
+            **env_kwargs: Forwarded to each worker's TetrisEnv constructor
+        """
+        self.num_envs = num_envs
+        self._conns = []
+        self._processes = []
+
+        ctx = multiprocessing.get_context()
+        for _ in range(num_envs):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(target=_worker, args=(child_conn, env_kwargs), daemon=True)
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+    def reset(self, seeds: Sequence[int]) -> List[Dict[str, Any]]:
+        """Reset every environment with its own seed.
+
+        Args:
+            seeds: One seed per environment
+
+        Returns:
+            One observation dict per environment
+        """
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"Need {self.num_envs} seeds, got {len(seeds)}")
+
+        for conn, seed in zip(self._conns, seeds):
+            conn.send(("reset", seed))
+        return [conn.recv() for conn in self._conns]
+
+    def step_placement(
+        self, actions: Sequence[PlacementAction]
+    ) -> List[Tuple[Dict[str, Any], float, bool, Dict[str, Any]]]:
+        """Execute one placement action per environment.
+
+        Args:
+            actions: One placement action per environment
+
+        Returns:
+            One (obs_dict, reward, done, info) tuple per environment
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Need {self.num_envs} actions, got {len(actions)}")
+
+        for conn, action in zip(self._conns, actions):
+            conn.send(("step_placement", (action.x, action.rot, action.use_hold)))
+        return [conn.recv() for conn in self._conns]
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=1.0)
+        self._conns = []
+        self._processes = []
+
+    def __enter__(self) -> "SubprocTetrisEnv":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()